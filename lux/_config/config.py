@@ -28,9 +28,19 @@ class Config:
         self._sampling_start = 10000
         self._sampling_cap = 30000
         self._sampling_flag = True
+        self._sampling_method = "random"
+        self._sampling_budget = False
         self._heatmap_flag = True
         self._plotting_backend = "vegalite"
         self._topk = 15
+        self._unique_values_cap = False
+        self._cardinality_sketch_threshold = False
+        self._cardinality_sketch_error = 0.01
+        self._value_index_cardinality = False
+        self._data_cube_cardinality = False
+        self._cache_dir = False
+        self._cache_size = 1024
+        self._metadata_threads = 1
         self._sort = "descending"
         self._pandas_fallback = True
         self._interestingness_fallback = True
@@ -59,6 +69,187 @@ class Config:
                 stacklevel=2,
             )
 
+    @property
+    def unique_values_cap(self):
+        return self._unique_values_cap
+
+    @unique_values_cap.setter
+    def unique_values_cap(self, cap: Union[int, bool]):
+        """
+        Setting parameter to bound the number of unique values stored as metadata for each column
+
+        Parameters
+        ----------
+        cap : Union[int,bool]
+            False: if all unique values of every column are stored
+            cap: number of most frequent unique values to store for high-cardinality columns
+        """
+        if (type(cap) == int and cap > 0) or cap is False:
+            self._unique_values_cap = cap
+        else:
+            warnings.warn(
+                "Parameter to lux.config.unique_values_cap must be a positive integer or False.",
+                stacklevel=2,
+            )
+
+    @property
+    def cardinality_sketch_threshold(self):
+        return self._cardinality_sketch_threshold
+
+    @cardinality_sketch_threshold.setter
+    def cardinality_sketch_threshold(self, threshold: Union[int, bool]):
+        """
+        Setting parameter to estimate column cardinality with a HyperLogLog sketch on large dataframes
+
+        Parameters
+        ----------
+        threshold : Union[int,bool]
+            False: if the cardinality of every column is computed exactly
+            threshold: number of rows above which the cardinality of high-cardinality columns is estimated
+        """
+        if (type(threshold) == int and threshold > 0) or threshold is False:
+            self._cardinality_sketch_threshold = threshold
+        else:
+            warnings.warn(
+                "Parameter to lux.config.cardinality_sketch_threshold must be a positive integer or False.",
+                stacklevel=2,
+            )
+
+    @property
+    def cardinality_sketch_error(self):
+        return self._cardinality_sketch_error
+
+    @cardinality_sketch_error.setter
+    def cardinality_sketch_error(self, error: float):
+        """
+        Setting parameter for the relative standard error of the sketched cardinality estimates
+
+        Parameters
+        ----------
+        error : float
+            Relative standard error between 0 and 1 (e.g., 0.01 for 1%). Smaller errors use larger sketches.
+        """
+        if isinstance(error, (int, float)) and not isinstance(error, bool) and 0 < error < 1:
+            self._cardinality_sketch_error = error
+        else:
+            warnings.warn(
+                "Parameter to lux.config.cardinality_sketch_error must be a float between 0 and 1.",
+                stacklevel=2,
+            )
+
+    @property
+    def value_index_cardinality(self):
+        return self._value_index_cardinality
+
+    @value_index_cardinality.setter
+    def value_index_cardinality(self, cardinality: Union[int, bool]):
+        """
+        Setting parameter to index the row positions of each value of low-cardinality columns for filtering
+
+        Parameters
+        ----------
+        cardinality : Union[int,bool]
+            False: if filters are evaluated by scanning the filtered columns
+            cardinality: maximum number of unique values of the columns that are indexed
+        """
+        if (type(cardinality) == int and cardinality > 0) or cardinality is False:
+            self._value_index_cardinality = cardinality
+        else:
+            warnings.warn(
+                "Parameter to lux.config.value_index_cardinality must be a positive integer or False.",
+                stacklevel=2,
+            )
+
+    @property
+    def data_cube_cardinality(self):
+        return self._data_cube_cardinality
+
+    @data_cube_cardinality.setter
+    def data_cube_cardinality(self, cardinality: Union[int, bool]):
+        """
+        Setting parameter to precompute the counts of the values of low-cardinality columns and of their pairs
+
+        Parameters
+        ----------
+        cardinality : Union[int,bool]
+            False: if the bar charts counting Records are computed by grouping the data
+            cardinality: maximum number of unique values of the columns whose counts are precomputed
+        """
+        if (type(cardinality) == int and cardinality > 0) or cardinality is False:
+            self._data_cube_cardinality = cardinality
+        else:
+            warnings.warn(
+                "Parameter to lux.config.data_cube_cardinality must be a positive integer or False.",
+                stacklevel=2,
+            )
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, directory: Union[str, bool]):
+        """
+        Setting parameter for the directory where metadata and recommendations are persisted across sessions
+
+        Parameters
+        ----------
+        directory : Union[str,bool]
+            False: if metadata and recommendations are not persisted
+            directory: path of the directory storing the cached metadata and recommendations
+        """
+        if isinstance(directory, str) or directory is False:
+            self._cache_dir = directory
+        else:
+            warnings.warn(
+                "Parameter to lux.config.cache_dir must be a string or False.",
+                stacklevel=2,
+            )
+
+    @property
+    def cache_size(self):
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, size: Union[int, float]):
+        """
+        Setting parameter for the maximum size of the cache directory, beyond which the least recently used entries are evicted
+
+        Parameters
+        ----------
+        size : Union[int,float]
+            Maximum size of the cache directory in megabytes
+        """
+        if isinstance(size, (int, float)) and not isinstance(size, bool) and size > 0:
+            self._cache_size = size
+        else:
+            warnings.warn(
+                "Parameter to lux.config.cache_size must be a positive number.",
+                stacklevel=2,
+            )
+
+    @property
+    def metadata_threads(self):
+        return self._metadata_threads
+
+    @metadata_threads.setter
+    def metadata_threads(self, num_threads: int):
+        """
+        Setting parameter for the number of threads computing the metadata of the columns in parallel
+
+        Parameters
+        ----------
+        num_threads : int
+            Number of threads in the pool computing the per-column metadata (1 computes it sequentially)
+        """
+        if isinstance(num_threads, int) and not isinstance(num_threads, bool) and num_threads > 0:
+            self._metadata_threads = num_threads
+        else:
+            warnings.warn(
+                "Parameter to lux.config.metadata_threads must be a positive integer.",
+                stacklevel=2,
+            )
+
     @property
     def sort(self):
         return self._sort
@@ -206,6 +397,63 @@ class Config:
                 stacklevel=2,
             )
 
+    @property
+    def sampling_method(self):
+        """
+        Parameters
+        ----------
+        method : str
+            Method used to sample large dataframes, either "random" or "stratified".
+        """
+        return self._sampling_method
+
+    @sampling_method.setter
+    def sampling_method(self, method: str) -> None:
+        """
+        Parameters
+        ----------
+        method : str
+            Method used to sample large dataframes, either "random" or "stratified".
+            A stratified sample keeps rows of every value of the low-cardinality nominal attributes.
+        """
+        if method in ["random", "stratified"]:
+            self._sampling_method = method
+        else:
+            warnings.warn(
+                "The sampling method must be either 'random' or 'stratified'.",
+                stacklevel=2,
+            )
+
+    @property
+    def sampling_budget(self):
+        """
+        Parameters
+        ----------
+        budget : Union[int,float,bool]
+            Latency budget of the recommendations in seconds, from which the sample size is derived,
+            or False to sample based on sampling_start and sampling_cap.
+        """
+        return self._sampling_budget
+
+    @sampling_budget.setter
+    def sampling_budget(self, budget: Union[int, float, bool]) -> None:
+        """
+        Parameters
+        ----------
+        budget : Union[int,float,bool]
+            Latency budget of the recommendations in seconds, from which the sample size is derived,
+            or False to sample based on sampling_start and sampling_cap.
+        """
+        if budget is False or (
+            isinstance(budget, (int, float)) and not isinstance(budget, bool) and budget > 0
+        ):
+            self._sampling_budget = budget
+        else:
+            warnings.warn(
+                "The sampling budget must be a positive number of seconds or False.",
+                stacklevel=2,
+            )
+
     @property
     def heatmap(self):
         """
@@ -15,6 +15,7 @@
 import lux
 from lux.interestingness.interestingness import interestingness
 from lux.processor.Compiler import Compiler
+from lux.executor.PandasExecutor import PandasExecutor
 from lux.core.frame import LuxDataFrame
 from lux.vis.VisList import VisList
 from lux.utils import utils
@@ -47,7 +48,13 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
         lux.Clause("?", data_model="measure"),
     ]
     intent.extend(filter_specs)
-    vlist = VisList(intent, ldf)
+    # with Pandas, every pair is scored from a correlation matrix, so that only the top-ranked vis are executed
+    matrix_scoring = lux.config.executor.name == "PandasExecutor"
+    if matrix_scoring:
+        vlist = VisList(intent)
+        vlist.refresh_source(ldf, execute=False)
+    else:
+        vlist = VisList(intent, ldf)
     examples = ""
     if len(vlist) > 1:
         measures = vlist[0].get_attr_by_data_model("measure")
@@ -64,7 +71,18 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
     # Doesn't make sense to compute correlation if less than 4 data values
     if len(ldf) < 5:
         ignore_rec_flag = True
-    # Then use the data populated in the vis list to compute score
+    if ignore_rec_flag:
+        recommendation["collection"] = []
+        return recommendation
+    # correlation matrices of the measures, computed once per set of filters
+    matrices = {}
+    measure_index = {}
+    if matrix_scoring:
+        for vis in vlist:
+            for clause in vis.get_attr_by_data_model("measure"):
+                measure_index.setdefault(clause.attribute, len(measure_index))
+    computed_pairs = set()
+    # Then score each pair, from the correlation matrix or the data populated in the vis list
     for vis in vlist:
         measures = vis.get_attr_by_data_model("measure")
         if len(measures) < 2:
@@ -74,30 +92,30 @@ def correlation(ldf: LuxDataFrame, ignore_transpose: bool = True):
         msr1 = measures[0].attribute
         msr2 = measures[1].attribute
         if ignore_transpose:
-            check_transpose = check_transpose_not_computed(vlist, msr1, msr2)
+            # only the latter of {X,Y} and {Y,X} is scored
+            check_transpose = (msr2, msr1) in computed_pairs
+            computed_pairs.add((msr1, msr2))
         else:
             check_transpose = True
-        if check_transpose:
-            vis.score = interestingness(vis, ldf)
-        else:
+        if not check_transpose:
             vis.score = -1
-    if ignore_rec_flag:
-        recommendation["collection"] = []
-        return recommendation
+        elif matrix_scoring:
+            filters = utils.get_filter_specs(vis._inferred_intent)
+            key = tuple((filter.attribute, filter.filter_op, repr(filter.value)) for filter in filters)
+            if key not in matrices:
+                matrices[key] = PandasExecutor.execute_correlation(ldf, list(measure_index), filters)
+            matrix, num_rows = matrices[key]
+            score = matrix[measure_index[msr1], measure_index[msr2]]
+            # like the monotonicity of the scatterplot, which needs at least 10 rows and distinct measures
+            if num_rows < 10 or msr1 == msr2 or np.isnan(score):
+                vis.score = -1
+            else:
+                vis.score = float(abs(score))
+        else:
+            vis.score = interestingness(vis, ldf)
     vlist.sort()
     vlist = vlist.showK()
+    if matrix_scoring:
+        lux.config.executor.execute(vlist, ldf)
     recommendation["collection"] = vlist
     return recommendation
-
-
-def check_transpose_not_computed(vlist: VisList, a: str, b: str):
-    transpose_exist = list(
-        filter(
-            lambda x: (x._inferred_intent[0].attribute == b) and (x._inferred_intent[1].attribute == a),
-            vlist,
-        )
-    )
-    if len(transpose_exist) > 0:
-        return transpose_exist[0].score == -1
-    else:
-        return False
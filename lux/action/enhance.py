@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import lux
-from lux.interestingness.interestingness import interestingness
+from lux.interestingness.interestingness import score_top_k
 from lux.processor.Compiler import Compiler
 from lux.utils import utils
 
@@ -62,11 +62,11 @@ def enhance(ldf):
         clause.channel = ""
     intent = filters + attr_specs
     intent.append("?")
-    vlist = lux.vis.VisList.VisList(intent, ldf)
+    vlist = lux.vis.VisList.VisList(intent)
+    vlist.refresh_source(ldf, execute=False)
 
-    # Then use the data populated in the vis list to compute score
-    for vis in vlist:
-        vis.score = interestingness(vis, ldf)
+    # Then populate and score the vis that can still make the top-k
+    vlist = score_top_k(vlist, ldf)
 
     vlist.sort()
     vlist = vlist.showK()
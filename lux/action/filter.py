@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import lux
-from lux.interestingness.interestingness import interestingness
+from lux.interestingness.interestingness import interestingness, score_top_k
 from lux.vis.Vis import Vis
 from lux.vis.VisList import VisList
 from lux.processor.Compiler import Compiler
@@ -132,10 +132,16 @@ def add_filter(ldf):
         # array of possible values for attribute
         arr = ldf[last.attribute].unique().tolist()
         output.append(lux.Clause(last.attribute, last.attribute, arr))
-    vlist = lux.vis.VisList.VisList(output, ldf)
-    vlist_copy = lux.vis.VisList.VisList(output, ldf)
-    for i in range(len(vlist_copy)):
-        vlist[i].score = interestingness(vlist_copy[i], ldf)
+    if recommendation["action"] == "Similarity":
+        vlist = lux.vis.VisList.VisList(output, ldf)
+        vlist_copy = lux.vis.VisList.VisList(output, ldf)
+        for i in range(len(vlist_copy)):
+            vlist[i].score = interestingness(vlist_copy[i], ldf)
+    else:
+        vlist = lux.vis.VisList.VisList(output)
+        vlist.refresh_source(ldf, execute=False)
+        # only populate and score the vis that can still make the top-k
+        vlist = score_top_k(vlist, ldf)
     vlist.sort()
     vlist = vlist.showK()
     if recommendation["action"] == "Similarity":
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from lux.interestingness.interestingness import interestingness
+from lux.interestingness.interestingness import batch_interestingness, score_top_k
 from lux.vis.VisList import VisList
 import lux
 from lux.utils import utils
@@ -103,9 +103,17 @@ def univariate(ldf, *args):
     if ignore_rec_flag:
         recommendation["collection"] = []
         return recommendation
-    vlist = VisList(intent, ldf)
-    for vis in vlist:
-        vis.score = interestingness(vis, ldf)
-    vlist.sort()
+    if data_type_constraint == "nominal":
+        # only populate and score the bar charts that can still make the top-k
+        vlist = VisList(intent)
+        vlist.refresh_source(ldf, execute=False)
+        vlist = score_top_k(vlist, ldf)
+        vlist.sort()
+        vlist = vlist.showK()
+    else:
+        vlist = VisList(intent, ldf)
+        for vis, score in zip(vlist, batch_interestingness(vlist, ldf)):
+            vis.score = score
+        vlist.sort()
     recommendation["collection"] = vlist
     return recommendation
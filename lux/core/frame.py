@@ -20,6 +20,7 @@ from lux.vis.VisList import VisList
 from lux.history.history import History
 from lux.utils.date_utils import is_datetime_series
 from lux.utils.message import Message
+from lux.utils import utils
 from lux.utils.utils import check_import_lux_widget
 from typing import Dict, Union, List, Callable
 
@@ -29,6 +30,35 @@ import traceback
 import lux
 
 
+class _LuxIndexer:
+    """
+    Wrapper of the df.loc, df.iloc, df.at and df.iat indexers of a LuxDataFrame, which notifies the
+    LuxDataFrame of the columns written through them. Reads and every other attribute are passed through
+    to the pandas indexer.
+    """
+
+    def __init__(self, indexer, ldf, positional: bool):
+        self._indexer = indexer
+        self._ldf = ldf
+        self._positional = positional
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    def __setitem__(self, key, value):
+        shape = self._ldf.shape
+        self._indexer[key] = value
+        column_key = key[1] if isinstance(key, tuple) and len(key) == 2 else slice(None)
+        self._ldf._expire_written(column_key, self._positional, resized=self._ldf.shape != shape)
+
+    def __call__(self, *args, **kwargs):
+        # e.g., df.loc(axis=1)
+        return _LuxIndexer(self._indexer(*args, **kwargs), self._ldf, self._positional)
+
+    def __getattr__(self, name):
+        return getattr(self._indexer, name)
+
+
 class LuxDataFrame(pd.DataFrame):
     """
     A subclass of pd.DataFrame that supports all dataframe operations while housing other variables and functions for generating visual recommendations.
@@ -87,6 +117,20 @@ class LuxDataFrame(pd.DataFrame):
         self.unique_values = None
         self.cardinality = None
         self._min_max = None
+        self._column_stats = None
+        self._datetime_lookups = None
+        self._value_index = None
+        self._sort_index = None
+        self._sort_index_filters = None
+        self._data_cube = None
+        self._dirty_columns = None
+        self._vis_cache = None
+        self._filter_cache = None
+        self._overall_cache = None
+        self._data_version = 0
+        self._data_shape = None
+        self._fingerprint = None
+        self._column_fingerprints = None
         self.pre_aggregated = None
         self._type_override = {}
         warnings.formatwarning = lux.warning_format
@@ -115,13 +159,25 @@ class LuxDataFrame(pd.DataFrame):
             self.maintain_metadata()
         return self._data_type
 
-    def maintain_metadata(self):
+    def maintain_metadata(self, use_cache: bool = False):
+        """
+        Compute the metadata of the dataframe if it is not fresh.
+
+        Parameters
+        ----------
+        use_cache : bool
+            Whether to reuse the metadata of a dataframe with identical data, looked up by fingerprint in the
+            disk cache configured by lux.config.cache_dir (and in memory, for the entries of this session). The
+            cache is skipped when lux.config.cache_dir is not set, and only the dataframes that are displayed
+            use it, rather than every derived dataframe that holds the data of a vis.
+        """
         is_sql_tbl = lux.config.executor.name == "SQLExecutor"
         if lux.config.SQLconnection != "" and is_sql_tbl:
             from lux.executor.SQLExecutor import SQLExecutor
 
             lux.config.executor = SQLExecutor()
 
+        self._sync_data_version()
         # Check that metadata has not yet been computed
         if not hasattr(self, "_metadata_fresh") or not self._metadata_fresh:
             # only compute metadata information if the dataframe is non-empty
@@ -131,15 +187,74 @@ class LuxDataFrame(pd.DataFrame):
                 self._metadata_fresh = True
             else:
                 if len(self) > 0:
-                    lux.config.executor.compute_stats(self)
-                    lux.config.executor.compute_dataset_metadata(self)
+                    if self._dirty_columns:
+                        # only recompute the metadata of the columns assigned since the last computation
+                        dirty_columns = [attr for attr in self.columns if attr in self._dirty_columns]
+                        lux.config.executor.compute_stats(self, dirty_columns)
+                        lux.config.executor.compute_dataset_metadata(self, dirty_columns)
+                    elif use_cache and self._load_cached_metadata():
+                        # the value index and data cube depend on their own settings, so they are rebuilt
+                        # rather than cached (the value index also holds row positions)
+                        lux.config.executor.compute_value_index(self)
+                        lux.config.executor.compute_data_cube(self)
+                    else:
+                        lux.config.executor.compute_stats(self)
+                        lux.config.executor.compute_dataset_metadata(self)
+                        if use_cache:
+                            self._save_cached_metadata()
                     self._infer_structure()
                     self._metadata_fresh = True
+                    self._dirty_columns = set()
+
+    def _sync_data_version(self) -> int:
+        """
+        Version of the data, which is bumped by the overridden pandas mutation methods below.
+        As a safeguard, resizing mutations that did not go through these methods are detected by comparing
+        the shape of the dataframe against the one recorded at the last mutation, which bumps the version
+        and expires the metadata and recommendations.
+
+        Returns
+        -------
+        int
+            Version of the data, which is incremented every time the data is mutated.
+        """
+        if self.shape != self._data_shape:
+            if self._data_shape is None:
+                self._data_shape = self.shape
+            else:
+                self._expire_data()
+        return self._data_version
 
-    def expire_recs(self):
+    def _bump_data_version(self):
+        """
+        Record a mutation whose effect on the metadata and recommendations has already been handled.
+        """
+        # pandas may mutate the frame while it is being constructed, before the version is initialized
+        if getattr(self, "_data_version", None) is not None:
+            self._data_version += 1
+            self._data_shape = self.shape
+            # the cached filter results and overall vis of previous versions can no longer be looked up
+            self._filter_cache = None
+            self._overall_cache = None
+
+    def expire_recs(self, attributes=None):
         """
         Expires and resets all recommendations
+
+        Parameters
+        ----------
+        attributes : set, optional
+            If specified, the visualizations of the expired recommendations that do not involve any of
+            these attributes are kept, so that they are reused instead of recomputed with the new recommendations.
         """
+        if attributes is None or not self._vis_cache:
+            self._vis_cache = None
+        else:
+            self._vis_cache = {
+                signature: cached_vis
+                for signature, cached_vis in self._vis_cache.items()
+                if not cached_vis["attributes"] & attributes
+            }
         self._recs_fresh = False
         self._recommendation = {}
         self._widget = None
@@ -151,35 +266,135 @@ class LuxDataFrame(pd.DataFrame):
         Expire all saved metadata to trigger a recomputation the next time the data is required.
         """
         self._metadata_fresh = False
+        self._dirty_columns = None
         self._data_type = None
         self.unique_values = None
         self.cardinality = None
         self._min_max = None
+        self._column_stats = None
+        self._datetime_lookups = None
+        self._value_index = None
+        self._sort_index = None
+        self._sort_index_filters = None
+        self._data_cube = None
         self.pre_aggregated = None
 
     #####################
     ## Override Pandas ##
     #####################
-    def __getattr__(self, name):
-        ret_value = super(LuxDataFrame, self).__getattr__(name)
-        self.expire_metadata()
-        self.expire_recs()
-        return ret_value
-
     def _set_axis(self, axis, labels):
         super(LuxDataFrame, self)._set_axis(axis, labels)
-        self.expire_metadata()
-        self.expire_recs()
+        self._expire_data()
 
     def _update_inplace(self, *args, **kwargs):
         super(LuxDataFrame, self)._update_inplace(*args, **kwargs)
-        self.expire_metadata()
-        self.expire_recs()
+        self._expire_data()
+
+    def __delitem__(self, key):
+        super(LuxDataFrame, self).__delitem__(key)
+        self._expire_data()
+
+    def insert(self, loc, column, value, *args, **kwargs):
+        super(LuxDataFrame, self).insert(loc, column, value, *args, **kwargs)
+        self._expire_column(column)
+
+    @property
+    def loc(self):
+        return _LuxIndexer(super(LuxDataFrame, self).loc, self, positional=False)
+
+    @property
+    def iloc(self):
+        return _LuxIndexer(super(LuxDataFrame, self).iloc, self, positional=True)
+
+    @property
+    def at(self):
+        return _LuxIndexer(super(LuxDataFrame, self).at, self, positional=False)
+
+    @property
+    def iat(self):
+        return _LuxIndexer(super(LuxDataFrame, self).iat, self, positional=True)
+
+    def __setitem__(self, key, value):
+        shape = self.shape
+        super(LuxDataFrame, self).__setitem__(key, value)
+        # assignments of a single column are handled by _set_item
+        if isinstance(key, (slice, pd.DataFrame)):
+            # rows selected by a slice or a mask, which may affect every column
+            self._expire_data()
+        elif pd.api.types.is_list_like(key) and not isinstance(key, tuple):
+            if pd.api.types.is_bool_dtype(pd.Index(key)):
+                self._expire_data()
+            else:
+                self._expire_written(list(key), positional=False, resized=self.shape != shape)
 
     def _set_item(self, key, value):
         super(LuxDataFrame, self)._set_item(key, value)
+        self._expire_column(key)
+
+    if hasattr(pd.DataFrame, "_maybe_cache_changed"):
+
+        def _maybe_cache_changed(self, item, value, *args, **kwargs):
+            # Called back by a cached column (e.g., df["A"]) that was modified in place, such as by
+            # df["A"].fillna(inplace=True), which no public method of the dataframe sees
+            super(LuxDataFrame, self)._maybe_cache_changed(item, value, *args, **kwargs)
+            self._expire_column(item)
+
+    def _expire_data(self):
+        """
+        Expire the metadata and recommendations after a mutation that may affect every column.
+        """
+        self._column_fingerprints = None
         self.expire_metadata()
         self.expire_recs()
+        self._bump_data_version()
+
+    def _expire_written(self, column_key, positional: bool, resized: bool = False):
+        """
+        Expire the columns written through an indexer, given its column key (labels, or positions for
+        df.iloc and df.iat), or all of them if the dataframe was resized or the written columns cannot be
+        resolved (e.g., when new columns are added).
+        """
+        columns = self.columns.to_series()
+        try:
+            columns = columns.iloc[column_key] if positional else columns.loc[column_key]
+        except Exception:
+            columns = None
+        if resized or columns is None:
+            self._expire_data()
+        elif isinstance(columns, pd.Series):
+            for attribute in columns.unique():
+                self._expire_column(attribute)
+        else:
+            self._expire_column(columns)
+
+    def _expire_column(self, attribute):
+        if getattr(self, "_column_fingerprints", None):
+            # only the fingerprint of the assigned column needs to be rehashed
+            self._column_fingerprints.pop(attribute, None)
+        if getattr(self, "_datetime_lookups", None):
+            self._datetime_lookups.pop(attribute, None)
+        if getattr(self, "_value_index", None):
+            self._value_index.pop(attribute, None)
+        if getattr(self, "_sort_index", None):
+            self._sort_index.pop(attribute, None)
+        if getattr(self, "_sort_index_filters", None):
+            self._sort_index_filters.pop(attribute, None)
+        if getattr(self, "_data_cube", None):
+            self._data_cube["columns"].pop(attribute, None)
+            self._data_cube["pairs"] = {
+                pair: counts
+                for pair, counts in self._data_cube["pairs"].items()
+                if attribute not in pair
+            }
+        if getattr(self, "_dirty_columns", None) is None:
+            self.expire_metadata()
+            self.expire_recs()
+        else:
+            # Assigning a column only affects the metadata and recommendations involving that column
+            self._dirty_columns.add(attribute)
+            self._metadata_fresh = False
+            self.expire_recs(attributes={attribute})
+        self._bump_data_version()
 
     def _infer_structure(self):
         # If the dataframe is very small and the index column is not a range index, then it is likely that this is an aggregated data
@@ -308,6 +523,7 @@ class LuxDataFrame(pd.DataFrame):
 
     @property
     def recommendation(self):
+        self._sync_data_version()
         if self._recommendation is not None and self._recommendation == {}:
             from lux.processor.Compiler import Compiler
 
@@ -360,7 +576,9 @@ class LuxDataFrame(pd.DataFrame):
         if self._prev is not None:
             rec_df = self._prev
             rec_df._message = Message()
-            rec_df.maintain_metadata()  # the prev dataframe may not have been printed before
+            rec_df.maintain_metadata(
+                use_cache=True
+            )  # the prev dataframe may not have been printed before
             last_event = self.history._events[-1].name
             rec_df._message.add(
                 f"Lux is visualizing the previous version of the dataframe before you applied <code>{last_event}</code>."
@@ -397,24 +615,32 @@ class LuxDataFrame(pd.DataFrame):
         # Check that recs has not yet been computed
         if not hasattr(rec_df, "_recs_fresh") or not rec_df._recs_fresh:
             is_sql_tbl = lux.config.executor.name == "SQLExecutor"
-            rec_infolist = []
-            from lux.action.row_group import row_group
-            from lux.action.column_group import column_group
-
-            # TODO: Rewrite these as register action inside default actions
-            if rec_df.pre_aggregated:
-                if rec_df.columns.name is not None:
-                    rec_df._append_rec(rec_infolist, row_group(rec_df))
-                rec_df._append_rec(rec_infolist, column_group(rec_df))
-            elif not (len(rec_df) < 5 and not rec_df.pre_aggregated and not is_sql_tbl) and not (
-                self.index.nlevels >= 2 or self.columns.nlevels >= 2
-            ):
-                from lux.action.custom import custom_actions
-
-                # generate vis from globally registered actions and append to dataframe
-                custom_action_collection = custom_actions(rec_df)
-                for rec in custom_action_collection:
-                    rec_df._append_rec(rec_infolist, rec)
+            rec_infolist = rec_df._load_cached_recs()
+            if rec_infolist is None:
+                rec_infolist = []
+                # the filters and overall vis shared by the scored vis are evaluated once per recommendation pass
+                rec_df._filter_cache = None
+                rec_df._overall_cache = None
+                from lux.action.row_group import row_group
+                from lux.action.column_group import column_group
+
+                # TODO: Rewrite these as register action inside default actions
+                if rec_df.pre_aggregated:
+                    if rec_df.columns.name is not None:
+                        rec_df._append_rec(rec_infolist, row_group(rec_df))
+                    rec_df._append_rec(rec_infolist, column_group(rec_df))
+                elif not (len(rec_df) < 5 and not rec_df.pre_aggregated and not is_sql_tbl) and not (
+                    self.index.nlevels >= 2 or self.columns.nlevels >= 2
+                ):
+                    from lux.action.custom import custom_actions
+
+                    # generate vis from globally registered actions and append to dataframe
+                    custom_action_collection = custom_actions(rec_df)
+                    for rec in custom_action_collection:
+                        rec_df._append_rec(rec_infolist, rec)
+                    lux.config.update_actions["flag"] = False
+                rec_df._save_cached_recs(rec_infolist)
+            else:
                 lux.config.update_actions["flag"] = False
 
             # Store _rec_info into a more user-friendly dictionary form
@@ -425,6 +651,7 @@ class LuxDataFrame(pd.DataFrame):
                 if len(vlist) > 0:
                     rec_df._recommendation[action_type] = vlist
             rec_df._rec_info = rec_infolist
+            rec_df._cache_recommended_vis()
             rec_df.show_all_column_vis()
             self._widget = rec_df.render_widget()
         # re-render widget for the current dataframe if previous rec is not recomputed
@@ -433,6 +660,170 @@ class LuxDataFrame(pd.DataFrame):
             self._widget = rec_df.render_widget()
         self._recs_fresh = True
 
+    #######################################################
+    ################ Persistent Disk Cache ################
+    #######################################################
+    @property
+    def fingerprint(self) -> str:
+        """
+        Fast content fingerprint of the dataframe, which is identical for dataframes holding identical data.
+        The fingerprint of every column is memoized until the column is mutated, so that only the columns
+        modified since the last call are rehashed.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the content of the dataframe
+        """
+        from lux.utils.cache import fingerprint
+
+        data_version = self._sync_data_version()
+        if self._fingerprint is None or self._fingerprint[0] != data_version:
+            if self._column_fingerprints is None:
+                self._column_fingerprints = {}
+            self._fingerprint = (data_version, fingerprint(self, self._column_fingerprints))
+        return self._fingerprint[1]
+
+    def _get_cache_key(self, kind: str):
+        """
+        Key of the metadata or recommendations of this dataframe in the metadata and disk caches,
+        combining its fingerprint with the settings that the cached results depend on.
+        Returns None for SQL tables, which are not cached.
+        """
+        if lux.config.executor.name == "SQLExecutor":
+            return None
+        settings = [
+            self._type_override,
+            lux.config.unique_values_cap,
+            lux.config.cardinality_sketch_threshold,
+            lux.config.cardinality_sketch_error,
+        ]
+        if kind == "recommendation":
+            settings += [self._intent, sorted(lux.config.actions), lux.config.topk, lux.config.sort]
+        return f"{kind}-{self.fingerprint}-{settings}"
+
+    def _load_cached_metadata(self) -> bool:
+        from lux.utils.cache import get_disk_cache, metadata_cache
+
+        # the dataframe is only fingerprinted when a cache is configured, since hashing every row is not free
+        disk_cache = get_disk_cache()
+        key = self._get_cache_key("metadata") if disk_cache is not None else None
+        if key is None:
+            return False
+        cached_metadata = metadata_cache.get(key)
+        if cached_metadata is None:
+            cached_metadata = disk_cache.get(key)
+            if cached_metadata is not None:
+                metadata_cache.put(key, cached_metadata)
+        elif key not in disk_cache:
+            # the metadata was computed while another cache directory was configured
+            disk_cache.put(key, cached_metadata)
+        if cached_metadata is None:
+            return False
+        for field, value in cached_metadata.items():
+            # copy the dictionaries, which are updated in place when columns are assigned
+            setattr(self, field, dict(value) if isinstance(value, dict) else value)
+        return True
+
+    def _save_cached_metadata(self):
+        from lux.utils.cache import get_disk_cache, metadata_cache
+
+        disk_cache = get_disk_cache()
+        key = self._get_cache_key("metadata") if disk_cache is not None else None
+        if key:
+            fields = [
+                "unique_values",
+                "cardinality",
+                "_min_max",
+                "_column_stats",
+                "_data_type",
+                "_length",
+            ]
+            metadata = {}
+            for field in fields:
+                value = getattr(self, field)
+                metadata[field] = dict(value) if isinstance(value, dict) else value
+            metadata_cache.put(key, metadata)
+            disk_cache.put(key, metadata)
+
+    def _load_cached_recs(self):
+        """
+        Load the recommendations persisted for identical data, re-executing only the recommended vis.
+        Returns None if the recommendations are not cached.
+        """
+        from lux.utils.cache import get_disk_cache
+
+        disk_cache = get_disk_cache()
+        key = self._get_cache_key("recommendation") if disk_cache is not None else None
+        cached_recs = disk_cache.get(key) if key else None
+        if cached_recs is None:
+            return None
+        rec_infolist = []
+        for rec_info in cached_recs:
+            # the cached vis are already compiled, so the source is attached after creating the VisList
+            collection = VisList(rec_info["collection"])
+            collection._source = self
+            for vis in collection:
+                vis._source = self
+            lux.config.executor.execute(collection, self)
+            rec_infolist.append({**rec_info, "collection": collection})
+        return rec_infolist
+
+    def _save_cached_recs(self, rec_infolist):
+        import copy
+        from lux.utils.cache import get_disk_cache
+
+        disk_cache = get_disk_cache()
+        key = self._get_cache_key("recommendation") if disk_cache is not None else None
+        if key:
+            cached_recs = []
+            for rec_info in rec_infolist:
+                collection = []
+                for vis in rec_info["collection"]:
+                    # only persist the compiled specification and score, not the data
+                    cached_vis = copy.copy(vis)
+                    cached_vis._source = None
+                    cached_vis._vis_data = None
+                    cached_vis._code = None
+                    collection.append(cached_vis)
+                cached_recs.append({**rec_info, "collection": collection})
+            disk_cache.put(key, cached_recs)
+
+    def _cache_recommended_vis(self):
+        """
+        Keep the data and score of every recommended vis, keyed by its signature, so that they can be reused
+        when the recommendations are regenerated after assigning columns that the vis does not involve.
+        The data is copied, as it is modified in place when the vis is rendered.
+        """
+        self._vis_cache = {}
+        if self._sampled is None:
+            return
+        for rec_info in self._rec_info:
+            for vis in rec_info["collection"]:
+                if vis._vis_data is None:
+                    # vis loaded from the disk cache are only executed once they are displayed
+                    continue
+                attributes = set(clause.attribute for clause in vis._inferred_intent)
+                self._vis_cache[utils.get_vis_signature(vis)] = {
+                    "attributes": attributes,
+                    "rows": self._sampled.index,
+                    "data": vis._vis_data.copy(),
+                    "score": vis.score,
+                }
+
+    def _get_cached_vis(self, vis: Vis):
+        """
+        Cached data and score of a recommended vis identical to the given one (see _cache_recommended_vis),
+        or None if there is none or if it was computed from other rows than the current (sampled) data,
+        e.g., when the sample was drawn differently after assigning a column.
+        """
+        if not self._vis_cache or self._sampled is None:
+            return None
+        cached_vis = self._vis_cache.get(utils.get_vis_signature(vis))
+        if cached_vis is None or not cached_vis["rows"].equals(self._sampled.index):
+            return None
+        return cached_vis
+
     #######################################################
     ############## LuxWidget Result Display ###############
     #######################################################
@@ -555,7 +946,7 @@ class LuxDataFrame(pd.DataFrame):
                 self._pandas_only = False
             else:
                 if not self.index.nlevels >= 2 or self.columns.nlevels >= 2:
-                    self.maintain_metadata()
+                    self.maintain_metadata(use_cache=True)
 
                     if self._intent != [] and (not hasattr(self, "_compiled") or not self._compiled):
                         from lux.processor.Compiler import Compiler
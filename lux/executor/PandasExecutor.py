@@ -19,10 +19,33 @@ from lux.core.frame import LuxDataFrame
 from lux.executor.Executor import Executor
 from lux.utils import utils
 from lux.utils.date_utils import is_datetime_series
+from lux.utils.sketch import EXACT_CARDINALITY_LIMIT, approx_cardinality
 from lux.utils.utils import check_import_lux_widget, check_if_id_like, is_numeric_nan_column
 import warnings
 import lux
 
+# nominal attributes with at most this many values are guaranteed to be represented in stratified samples
+STRATIFY_CARDINALITY_LIMIT = 50
+# number of rows of each value of these attributes kept in stratified samples (if the sample size allows)
+STRATUM_MIN_ROWS = 10
+# cost model of lux.config.sampling_budget: fixed cost of generating a vis, and cost per row that it processes
+VIS_OVERHEAD_SECONDS = 0.005
+ROW_COST_SECONDS = 1e-7
+# smallest sample picked to meet lux.config.sampling_budget, however many visualizations are generated
+ADAPTIVE_SAMPLE_MIN = 1000
+# number of filter results cached per dataframe
+FILTER_CACHE_SIZE = 256
+# number of range filters on a numeric column (with different values) before it is sorted to answer them
+SORT_INDEX_MIN_FILTERS = 2
+# ranges selecting more than 1 / SORT_INDEX_GATHER_RATIO of the rows are scanned rather than gathered from
+# the sort index, since sorting back their positions costs more than the scan
+SORT_INDEX_GATHER_RATIO = 64
+# maximum number of values held in the 2D array of execute_batched_binning, which bounds its memory
+BINNING_CHUNK_SIZE = 1000000
+# name of the index level holding the filter values when aggregating the vis that only differ by them,
+# which (unlike a position) cannot be confused with integer column names
+FILTER_VALUE_LEVEL = "__lux_filter_value__"
+
 
 class PandasExecutor(Executor):
     """
@@ -44,22 +67,154 @@ class PandasExecutor(Executor):
         SAMPLE_CAP = lux.config.sampling_cap
         SAMPLE_FRAC = 0.75
 
-        if SAMPLE_FLAG and len(ldf) > SAMPLE_CAP:
+        SAMPLE_BUDGET = lux.config.sampling_budget
+
+        STRATIFIED = lux.config.sampling_method == "stratified"
+        sample_kind = "stratified sample" if STRATIFIED else "random sample"
+
+        if SAMPLE_FLAG and SAMPLE_BUDGET:
+            # size the sample from the estimated cost of the recommendations instead of the fixed thresholds
+            sample_size, num_vis = PandasExecutor._estimate_sample_size(ldf, SAMPLE_BUDGET)
+            # the sampling cap still bounds the sample, however large the budget
+            sample_size = min(sample_size, SAMPLE_CAP)
+            if len(ldf) > sample_size:
+                if ldf._sampled is None:  # memoize unfiltered sample df
+                    if STRATIFIED:
+                        ldf._sampled = PandasExecutor._stratified_sample(ldf, sample_size)
+                    else:
+                        ldf._sampled = ldf.sample(n=sample_size, random_state=1)
+                ldf._message.add_unique(
+                    f"Large dataframe detected: Lux is only visualizing a {sample_kind} of {len(ldf._sampled)} rows, "
+                    f"sized to generate the {num_vis} recommended visualizations within {SAMPLE_BUDGET} seconds.",
+                    priority=99,
+                )
+            else:
+                ldf._sampled = ldf
+        elif SAMPLE_FLAG and len(ldf) > SAMPLE_CAP:
             if ldf._sampled is None:  # memoize unfiltered sample df
-                ldf._sampled = ldf.sample(n=SAMPLE_CAP, random_state=1)
+                if STRATIFIED:
+                    ldf._sampled = PandasExecutor._stratified_sample(ldf, SAMPLE_CAP)
+                else:
+                    ldf._sampled = ldf.sample(n=SAMPLE_CAP, random_state=1)
             ldf._message.add_unique(
-                f"Large dataframe detected: Lux is only visualizing a random sample capped at {SAMPLE_CAP} rows.",
+                f"Large dataframe detected: Lux is only visualizing a {sample_kind} capped at {SAMPLE_CAP} rows.",
                 priority=99,
             )
         elif SAMPLE_FLAG and len(ldf) > SAMPLE_START:
             if ldf._sampled is None:  # memoize unfiltered sample df
-                ldf._sampled = ldf.sample(frac=SAMPLE_FRAC, random_state=1)
+                if STRATIFIED:
+                    ldf._sampled = PandasExecutor._stratified_sample(ldf, int(len(ldf) * SAMPLE_FRAC))
+                else:
+                    ldf._sampled = ldf.sample(frac=SAMPLE_FRAC, random_state=1)
             ldf._message.add_unique(
-                f"Large dataframe detected: Lux is only visualizing a random sample of {len(ldf._sampled)} rows.",
+                f"Large dataframe detected: Lux is only visualizing a {sample_kind} of {len(ldf._sampled)} rows.",
                 priority=99,
             )
         else:
             ldf._sampled = ldf
+        if ldf._sampled is not ldf and ldf._sampled._value_index is None:
+            # the filters of the vis are evaluated on the sample, whose row positions differ from the ldf
+            PandasExecutor.compute_value_index(ldf._sampled, cardinality=ldf.cardinality)
+        if ldf._sampled is not ldf and ldf._sampled._data_cube is None:
+            # likewise, the counts of the vis are those of the sample
+            PandasExecutor.compute_data_cube(ldf._sampled, cardinality=ldf.cardinality)
+
+    @staticmethod
+    def _estimate_sample_size(ldf: LuxDataFrame, budget: float):
+        """
+        Pick the number of rows to sample so that the recommendations are generated within a latency budget,
+        based on the number of visualizations that the registered actions are expected to generate from the
+        metadata. Each visualization is assumed to cost a fixed overhead, plus a cost proportional to the
+        number of rows it processes (doubled for the 2D binning of scatterplots).
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame to sample
+        budget : float
+            Latency budget of the recommendations, in seconds
+
+        Returns
+        -------
+        (sample_size, num_vis): Tuple[int, int]
+            Number of rows to sample, along with the estimated number of visualizations
+        """
+        data_types = [ldf._data_type.get(attr) for attr in ldf.columns] if ldf._data_type else []
+        num_attrs = len(data_types)
+        num_quantitative = data_types.count("quantitative")
+        num_vis = 0
+        row_cost_weight = 0
+        for name, option in lux.config.actions.items():
+            if option.display_condition is not None and not option.display_condition(ldf):
+                continue
+            if name == "correlation":
+                # scatterplots are binned in 2D, which costs about twice as much per row
+                action_num_vis = num_quantitative * (num_quantitative - 1) // 2
+                row_cost_weight += 2 * action_num_vis
+            else:
+                if option.args:
+                    action_num_vis = data_types.count(option.args[0])
+                elif name == "Filter":
+                    action_num_vis = sum(
+                        ldf.cardinality.get(attr, 0)
+                        for attr, data_type in zip(ldf.columns, data_types)
+                        if data_type == "nominal"
+                    )
+                elif name == "Generalize":
+                    action_num_vis = len(ldf._intent)
+                else:
+                    # Enhance adds every attribute to the current vis, which is also assumed for custom actions
+                    action_num_vis = num_attrs
+                row_cost_weight += action_num_vis
+            num_vis += action_num_vis
+        remaining_budget = budget - num_vis * VIS_OVERHEAD_SECONDS
+        if row_cost_weight == 0:
+            return len(ldf), num_vis
+        sample_size = int(remaining_budget / (row_cost_weight * ROW_COST_SECONDS))
+        return max(sample_size, ADAPTIVE_SAMPLE_MIN), num_vis
+
+    @staticmethod
+    def _stratified_sample(ldf: LuxDataFrame, sample_size: int) -> LuxDataFrame:
+        """
+        Sample rows such that every value of the low-cardinality nominal attributes is represented by up to
+        STRATUM_MIN_ROWS rows (fewer if needed to stay within the sample size), filling the rest of the
+        sample with uniformly random rows. Rare categories thereby survive even small samples.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame to sample
+        sample_size : int
+            Total number of rows in the sample
+
+        Returns
+        -------
+        sampled: lux.core.frame
+            Sampled rows, in their original order
+        """
+        import numpy as np
+
+        rng = np.random.RandomState(1)
+        # visit the rows in a random order, so that the first rows of each value form a random sample of it
+        permutation = rng.permutation(len(ldf))
+        strata = [
+            attr
+            for attr, data_type in (ldf._data_type or {}).items()
+            if data_type == "nominal"
+            and attr in ldf.columns
+            and ldf.cardinality.get(attr, STRATIFY_CARDINALITY_LIMIT + 1) <= STRATIFY_CARDINALITY_LIMIT
+        ]
+        num_groups = sum(ldf.cardinality[attr] for attr in strata)
+        rows_per_value = max(1, min(STRATUM_MIN_ROWS, sample_size // max(num_groups, 1)))
+        selected = np.zeros(len(ldf), dtype=bool)
+        for attr in strata:
+            codes = pd.factorize(ldf[attr].values[permutation])[0]
+            rank_within_value = pd.Series(codes).groupby(codes).cumcount().values
+            selected[permutation[rank_within_value < rows_per_value]] = True
+        required = permutation[selected[permutation]][:sample_size]
+        remaining = permutation[~selected[permutation]][: sample_size - len(required)]
+        positions = np.sort(np.concatenate([required, remaining]))
+        return ldf.iloc[positions]
 
     @staticmethod
     def execute(vislist: VisList, ldf: LuxDataFrame):
@@ -82,23 +237,36 @@ class PandasExecutor(Executor):
         None
         """
         PandasExecutor.execute_sampling(ldf)
+        batched = PandasExecutor.execute_cube_aggregate(vislist, ldf)
+        batched |= PandasExecutor.execute_batched_aggregate(
+            [vis for vis in vislist if id(vis) not in batched], ldf
+        )
+        batched |= PandasExecutor.execute_batched_binning(vislist, ldf)
         for vis in vislist:
-            # The vis data starts off being original or sampled dataframe
-            vis._vis_data = ldf._sampled
-            filter_executed = PandasExecutor.execute_filter(vis)
-            # Select relevant data based on attribute information
-            attributes = set([])
-            for clause in vis._inferred_intent:
-                if clause.attribute != "Record":
-                    attributes.add(clause.attribute)
-            # TODO: Add some type of cap size on Nrows ?
-            vis._vis_data = vis.data[list(attributes)]
-
-            if vis.mark == "bar" or vis.mark == "line" or vis.mark == "geographical":
-                PandasExecutor.execute_aggregate(vis, isFiltered=filter_executed)
-            elif vis.mark == "histogram":
-                PandasExecutor.execute_binning(ldf, vis)
-            elif vis.mark == "scatter":
+            cached_vis = ldf._get_cached_vis(vis)
+            if cached_vis is not None:
+                # Reuse the data of an identical recommended vis whose columns have not changed since,
+                # copied so that rendering this vis does not modify the cached data
+                vis._vis_data = cached_vis["data"].copy()
+            elif id(vis) in batched:
+                # The data was already aggregated together with the other vis sharing its group-by
+                pass
+            else:
+                # The vis data starts off being original or sampled dataframe
+                vis._vis_data = ldf._sampled
+                # Select relevant data based on attribute information
+                attributes = set([])
+                for clause in vis._inferred_intent:
+                    if clause.attribute != "Record":
+                        attributes.add(clause.attribute)
+                # TODO: Add some type of cap size on Nrows ?
+                filter_executed = PandasExecutor.execute_filter(vis, list(attributes))
+
+                if vis.mark == "bar" or vis.mark == "line" or vis.mark == "geographical":
+                    PandasExecutor.execute_aggregate(vis, isFiltered=filter_executed)
+                elif vis.mark == "histogram":
+                    PandasExecutor.execute_binning(ldf, vis)
+            if vis.mark == "scatter":
                 HBIN_START = 5000
                 if lux.config.heatmap and len(ldf) > HBIN_START:
                     vis._postbin = True
@@ -111,31 +279,272 @@ class PandasExecutor(Executor):
             vis.data.clear_intent()  # Ensure that intent is not propogated to the vis data
 
     @staticmethod
-    def execute_aggregate(vis: Vis, isFiltered=True):
+    def execute_cube_aggregate(vislist: VisList, ldf: LuxDataFrame) -> set:
         """
-        Aggregate data points on an axis for bar or line charts
+        Answer the bar and line charts counting the Records of one or two attributes (e.g., a group-by
+        and a color attribute, or a group-by attribute filtered on the value of another one) from the
+        counts precomputed in the data cube of the (sampled) data (see compute_data_cube), instead of
+        grouping the data. The result of each vis is then finished by execute_aggregate.
 
         Parameters
         ----------
-        vis: lux.Vis
-            lux.Vis object that represents a visualization
+        vislist: list[lux.Vis]
+            vis list that contains lux.Vis objects for visualization.
         ldf : lux.core.frame
             LuxDataFrame with specified intent.
 
         Returns
         -------
-        None
+        answered: set
+            Ids of the vis whose data was computed
+        """
+        data = ldf._sampled
+        answered = set()
+        if not data._data_cube:
+            return answered
+        for vis in vislist:
+            if vis.mark not in ["bar", "line", "geographical"]:
+                continue
+            if ldf._get_cached_vis(vis) is not None:
+                continue
+            spec = PandasExecutor._get_aggregate_spec(vis)
+            if spec is None or spec[1].attribute != "Record":
+                continue
+            groupby_attr, _, _, color_attr = spec
+            keys = [groupby_attr.attribute]
+            if color_attr is not None:
+                keys.append(color_attr.attribute)
+            filters = utils.get_filter_specs(vis._inferred_intent)
+            filter_value = None
+            if filters:
+                fltr = filters[0]
+                if len(filters) > 1 or color_attr is not None or fltr.filter_op != "=":
+                    continue
+                keys.append(fltr.attribute)
+                filter_value = fltr.value
+            result = PandasExecutor._count_from_cube(data, keys, filter_value)
+            if result is None:
+                continue
+            vis._vis_data = data
+            PandasExecutor.execute_aggregate(vis, isFiltered=bool(filters), aggregated=result)
+            answered.add(id(vis))
+        return answered
+
+    @staticmethod
+    def _count_from_cube(ldf: LuxDataFrame, keys: list, filter_value: object = None):
+        """
+        Number of Records of each (combination of) values of one or two attributes, in the same order as
+        a groupby, looked up from the data cube. With a filter value, the second attribute is filtered on it
+        instead of grouped by.
+
+        Returns
+        -------
+        counts: pd.DataFrame
+            Values of the attributes along with their "Record" counts, or None if the counts are not in the cube
         """
         import numpy as np
 
+        columns = ldf._data_cube["columns"]
+        if len(set(keys)) != len(keys) or any(attr not in columns for attr in keys):
+            return None
+        if len(keys) == 1:
+            counts = columns[keys[0]]["counts"]
+        else:
+            pair = tuple(keys)
+            if pair in ldf._data_cube["pairs"]:
+                counts = ldf._data_cube["pairs"][pair]
+            else:
+                counts = ldf._data_cube["pairs"][pair[::-1]].T
+            if filter_value is not None:
+                if is_datetime_series(columns[keys[1]]["values"]):
+                    # filters on datetime columns also match the strings that parse to their values
+                    return None
+                # the slot of a value is its code shifted by one, with missing values in the first slot
+                if utils.like_nan(filter_value):
+                    slot = 0
+                else:
+                    try:
+                        slot = columns[keys[1]]["slots"].get(filter_value)
+                    except TypeError:
+                        return None
+                if slot is None:
+                    counts = counts[:, 0:0].sum(axis=1)
+                else:
+                    counts = counts[:, slot]
+                keys = keys[:1]
+        # like a groupby, only the (combinations of) values that occur are kept
+        slots = np.nonzero(counts)
+        result = LuxDataFrame(
+            {
+                attr: columns[attr]["values"].iloc[attr_slots].values
+                for attr, attr_slots in zip(keys, slots)
+            }
+        )
+        result["Record"] = counts[slots]
+        try:
+            result = result.sort_values(by=keys, kind="mergesort", na_position="last")
+        except TypeError:
+            # values of mixed types are left to the groupby
+            return None
+        return result.reset_index(drop=True)
+
+    @staticmethod
+    def execute_batched_aggregate(vislist: VisList, ldf: LuxDataFrame) -> set:
+        """
+        Aggregate bar and line charts that share their group-by attributes and filters together, with a
+        single groupby over the (filtered) data that computes the measures of all of them at once,
+        rather than one groupby per vis. Likewise, the charts that only differ by the value of an equality
+        filter on the same attribute (e.g., those generated by the Filter action) are aggregated with a
+        single groupby over that attribute and the group-by attributes, which is then split by value.
+        The result of each vis is then finished by execute_aggregate.
+
+        Parameters
+        ----------
+        vislist: list[lux.Vis]
+            vis list that contains lux.Vis objects for visualization.
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+
+        Returns
+        -------
+        batched: set
+            Ids of the vis whose data was computed
+        """
+        batches = {}
+        for vis in vislist:
+            if vis.mark not in ["bar", "line", "geographical"]:
+                continue
+            if ldf._get_cached_vis(vis) is not None:
+                continue
+            spec = PandasExecutor._get_aggregate_spec(vis)
+            if spec is None:
+                continue
+            groupby_attr, measure_attr, agg_func, color_attr = spec
+            keys = (groupby_attr.attribute,)
+            if color_attr is not None:
+                keys += (color_attr.attribute,)
+            if measure_attr.attribute in keys:
+                continue
+            filters = PandasExecutor._get_filter_key(
+                [
+                    (clause.attribute, clause.filter_op, clause.value)
+                    for clause in utils.get_filter_specs(vis._inferred_intent)
+                ]
+            )
+            batches.setdefault((keys, filters), []).append((vis, measure_attr.attribute, agg_func))
+
+        batched = set()
+        filter_value_batches = {}
+        for (keys, filters), batch in batches.items():
+            if len(batch) < 2:
+                vis, measure, agg_func = batch[0]
+                if len(filters) == 1 and filters[0][1] == "=":
+                    fltr = utils.get_filter_specs(vis._inferred_intent)[0]
+                    if (
+                        not utils.like_nan(fltr.value)
+                        and fltr.attribute not in keys + (measure,)
+                        # filters on datetime columns also match the strings and datetime64 values that
+                        # parse to their values, which cannot be looked up by the grouped values
+                        and not is_datetime_series(ldf._sampled[fltr.attribute])
+                    ):
+                        filter_value_batches.setdefault(
+                            (keys, fltr.attribute, measure, agg_func), []
+                        ).append((vis, fltr.value))
+                continue
+            # the vis of a batch share their filters, which are only applied once
+            first_vis = batch[0][0]
+            first_vis._vis_data = ldf._sampled
+            measures = list(dict.fromkeys(measure for _, measure, _ in batch if measure != "Record"))
+            # like the data of a single vis, the filtered attributes are aggregated along with the measure
+            filter_attrs = list(
+                dict.fromkeys(
+                    clause.attribute
+                    for clause in utils.get_filter_specs(first_vis._inferred_intent)
+                    if clause.attribute not in keys
+                )
+            )
+            filter_executed = PandasExecutor.execute_filter(
+                first_vis, list(keys) + list(dict.fromkeys(measures + filter_attrs))
+            )
+            data = first_vis.data
+            grouped = data.groupby(list(keys), dropna=False, history=False)
+            # a single aggregation over all the measures per aggregation function, instead of one per vis
+            measures_by_func = {}
+            for _, measure, agg_func in batch:
+                if measure != "Record":
+                    measures_by_func.setdefault(agg_func, []).append(measure)
+            aggregated = {
+                agg_func: grouped[list(dict.fromkeys(func_measures + filter_attrs))]
+                .agg(agg_func)
+                .reset_index()
+                for agg_func, func_measures in measures_by_func.items()
+            }
+            if any(measure == "Record" for _, measure, _ in batch):
+                counts = grouped.size().reset_index(name="Record")
+            for vis, measure, agg_func in batch:
+                if measure == "Record":
+                    result = counts
+                else:
+                    result = aggregated[agg_func]
+                    columns = list(keys) + [measure] + [attr for attr in filter_attrs if attr != measure]
+                    columns = [attr for attr in columns if attr in result.columns]
+                    result = result[columns]
+                vis._vis_data = data
+                PandasExecutor.execute_aggregate(vis, isFiltered=filter_executed, aggregated=result)
+                batched.add(id(vis))
+
+        for (keys, filter_attr, measure, agg_func), batch in filter_value_batches.items():
+            if len(batch) < 2:
+                continue
+            columns = [
+                attr for attr in dict.fromkeys(list(keys) + [measure, filter_attr]) if attr != "Record"
+            ]
+            data = ldf._sampled[columns]
+            # group by a copy of the filtered attribute, so that the attribute itself is still aggregated
+            # like in the data of a single vis
+            filter_values = pd.Series(
+                data[filter_attr].values, index=data.index, name=FILTER_VALUE_LEVEL
+            )
+            grouped = data.groupby([filter_values] + list(keys), dropna=False, history=False)
+            try:
+                if measure == "Record":
+                    aggregated = grouped.size().rename("Record")
+                else:
+                    aggregated = grouped[list(dict.fromkeys([measure, filter_attr]))].agg(agg_func)
+                results = {
+                    value: group
+                    for value, group in aggregated.groupby(level=FILTER_VALUE_LEVEL, sort=False)
+                }
+            except TypeError:
+                # values of mixed types cannot be sorted together, so these vis are aggregated one at a time
+                continue
+            empty = aggregated.iloc[0:0]
+            for vis, value in batch:
+                # a value absent from the data filters out every row, so its groups are zero-filled
+                result = results.get(value, empty).droplevel(FILTER_VALUE_LEVEL).reset_index()
+                vis._vis_data = data
+                PandasExecutor.execute_aggregate(vis, isFiltered=True, aggregated=result)
+                batched.add(id(vis))
+        return batched
+
+    @staticmethod
+    def _get_aggregate_spec(vis: Vis):
+        """
+        Clauses that a bar or line chart is grouped by and aggregates, or None if the vis is not aggregated.
+
+        Returns
+        -------
+        (groupby_attr, measure_attr, agg_func, color_attr): Tuple[lux.Clause, lux.Clause, object, lux.Clause]
+            Group-by and measure clauses along with the aggregation function, and the color clause
+            (None if the vis has no color channel)
+        """
         x_attr = vis.get_attr_by_channel("x")[0]
         y_attr = vis.get_attr_by_channel("y")[0]
-        has_color = False
+        if x_attr.aggregation is None or y_attr.aggregation is None:
+            return None
         groupby_attr = ""
         measure_attr = ""
-        attr_unique_vals = []
-        if x_attr.aggregation is None or y_attr.aggregation is None:
-            return
+        agg_func = None
         if y_attr.aggregation != "":
             groupby_attr = x_attr
             measure_attr = y_attr
@@ -144,19 +553,62 @@ class PandasExecutor(Executor):
             groupby_attr = y_attr
             measure_attr = x_attr
             agg_func = x_attr.aggregation
+        if measure_attr == "":
+            return None
+        color_attr = None
+        if len(vis.get_attr_by_channel("color")) == 1:
+            color_attr = vis.get_attr_by_channel("color")[0]
+        return groupby_attr, measure_attr, agg_func, color_attr
+
+    @staticmethod
+    def execute_aggregate(vis: Vis, isFiltered=True, aggregated: pd.DataFrame = None):
+        """
+        Aggregate data points on an axis for bar or line charts
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+        aggregated : pd.DataFrame, optional
+            Result of the groupby already computed by execute_batched_aggregate, holding the group-by
+            (and color) attributes along with the measure, which is finished instead of grouping vis.data.
+
+        Returns
+        -------
+        None
+        """
+        import numpy as np
+
+        spec = PandasExecutor._get_aggregate_spec(vis)
+        if spec is None:
+            return
+        groupby_attr, measure_attr, agg_func, color_attr = spec
+        has_color = False
+        attr_unique_vals = []
         if groupby_attr.attribute in vis.data.unique_values.keys():
             attr_unique_vals = vis.data.unique_values.get(groupby_attr.attribute)
+        # the zero-filling below can only be done when every unique value is known (not just a top-K summary)
+        all_unique_vals_known = utils.has_all_unique_values(vis.data, groupby_attr.attribute)
         # checks if color is specified in the Vis
-        if len(vis.get_attr_by_channel("color")) == 1:
-            color_attr = vis.get_attr_by_channel("color")[0]
+        if color_attr is not None:
             color_attr_vals = vis.data.unique_values[color_attr.attribute]
             color_cardinality = len(color_attr_vals)
+            all_unique_vals_known = all_unique_vals_known and utils.has_all_unique_values(
+                vis.data, color_attr.attribute
+            )
             # NOTE: might want to have a check somewhere to not use categorical variables with greater than some number of categories as a Color variable----------------
             has_color = True
         else:
             color_cardinality = 1
         if measure_attr != "":
-            if measure_attr.attribute == "Record":
+            if aggregated is not None:
+                if measure_attr.attribute == "Record":
+                    vis._vis_data = aggregated
+                else:
+                    vis._vis_data = aggregated.__finalize__(vis.data)
+            elif measure_attr.attribute == "Record":
                 # need to get the index name so that we can rename the index column to "Record"
                 # if there is no index, default to "index"
                 index_name = vis.data.index.name
@@ -206,7 +658,7 @@ class PandasExecutor(Executor):
                 for i in range(0, len(result_vals)):
                     res_color_combi_vals.append([result_vals[i], result_color_vals[i]])
             # For filtered aggregation that have missing groupby-attribute values, set these aggregated value as 0, since no datapoints
-            if isFiltered or has_color and attr_unique_vals:
+            if (isFiltered or has_color and attr_unique_vals) and all_unique_vals_known:
                 N_unique_vals = len(attr_unique_vals)
                 if len(result_vals) != N_unique_vals * color_cardinality:
                     columns = vis.data.columns
@@ -247,7 +699,20 @@ class PandasExecutor(Executor):
 
             vis._vis_data = vis._vis_data.dropna(subset=[measure_attr.attribute])
             try:
-                vis._vis_data = vis._vis_data.sort_values(by=groupby_attr.attribute, ascending=True)
+                if (
+                    groupby_attr.data_type == "temporal"
+                    and vis._vis_data[groupby_attr.attribute].dtype == object
+                ):
+                    # order temporal strings chronologically, reusing the datetimes parsed by the type inference
+                    datetime_lookups = getattr(vis._source, "_datetime_lookups", None) or {}
+                    datetime_lookup = datetime_lookups.get(groupby_attr.attribute)
+                    if datetime_lookup is not None:
+                        sort_key = lambda values: values.map(datetime_lookup)
+                    else:
+                        sort_key = PandasExecutor._parse_datetime_key
+                    vis._vis_data = vis._vis_data.sort_values(by=groupby_attr.attribute, key=sort_key)
+                else:
+                    vis._vis_data = vis._vis_data.sort_values(by=groupby_attr.attribute, ascending=True)
             except TypeError:
                 warnings.warn(
                     f"\nLux detects that the attribute '{groupby_attr.attribute}' maybe contain mixed type."
@@ -259,6 +724,144 @@ class PandasExecutor(Executor):
             vis._vis_data = vis._vis_data.reset_index()
             vis._vis_data = vis._vis_data.drop(columns="index")
 
+    @staticmethod
+    def _parse_datetime_key(values: pd.Series) -> pd.Series:
+        """
+        Datetimes parsed from temporal strings to sort them by, or the strings themselves if they do not parse.
+        Only used when the datetimes of the column were not kept by the type inference (e.g., when its
+        metadata was loaded from the cache).
+        """
+        try:
+            return pd.to_datetime(values)
+        except (ValueError, TypeError, OverflowError):
+            return values
+
+    @staticmethod
+    def execute_batched_binning(vislist: VisList, ldf: LuxDataFrame) -> set:
+        """
+        Bin the unfiltered histograms of numeric columns (e.g., those of the Distribution action) together,
+        from a single 2D float array of their columns, rather than building a coerced and NaN-filtered
+        frame per vis. The missing values and ranges of all the columns are computed by vectorized passes
+        over the array (or taken from the precomputed _min_max), and each column is then counted by
+        np.histogram. The bins are the same as those of execute_binning.
+
+        Parameters
+        ----------
+        vislist: list[lux.Vis]
+            vis list that contains lux.Vis objects for visualization.
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+
+        Returns
+        -------
+        batched: set
+            Ids of the vis whose data was computed
+        """
+        import numpy as np
+
+        data = ldf._sampled
+        dtypes = data.dtypes
+        batches = {}
+        for vis in vislist:
+            if vis.mark != "histogram" or utils.get_filter_specs(vis._inferred_intent):
+                continue
+            if ldf._get_cached_vis(vis) is not None:
+                continue
+            bin_attribute = list(filter(lambda x: x.bin_size != 0, vis._inferred_intent))[0]
+            attr = bin_attribute.attribute
+            if attr not in data.columns or not data.columns.is_unique:
+                continue
+            dtype = dtypes[attr]
+            # other columns (e.g., numbers stored as strings) are coerced by execute_binning
+            if not (pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)):
+                continue
+            batches.setdefault(bin_attribute.bin_size, []).append((vis, attr))
+
+        batched = set()
+        for bin_size, batch in batches.items():
+            if len(batch) < 2:
+                continue
+            attrs = list(dict.fromkeys(attr for _, attr in batch))
+            # like np.histogram, the bins span the min/max of each column, which were precomputed unless sampled
+            if data is ldf and all(attr in (ldf._min_max or {}) for attr in attrs):
+                min_max = np.array([ldf._min_max[attr] for attr in attrs], dtype="float64")
+                first, last = min_max[:, 0], min_max[:, 1]
+            else:
+                first = last = None
+            counts = {}
+            chunk_width = max(1, BINNING_CHUNK_SIZE // max(len(data), 1))
+            for start in range(0, len(attrs), chunk_width):
+                chunk_attrs = attrs[start : start + chunk_width]
+                values = data[chunk_attrs].to_numpy(dtype="float64", na_value=np.nan).T
+                chunk_first = None if first is None else first[start : start + chunk_width]
+                chunk_last = None if last is None else last[start : start + chunk_width]
+                chunk_counts = PandasExecutor._histogram_columns(
+                    values, bin_size, chunk_first, chunk_last
+                )
+                for i, attr in enumerate(chunk_attrs):
+                    if chunk_counts[i] is not None:
+                        counts[attr] = chunk_counts[i]
+            for vis, attr in batch:
+                if attr not in counts:
+                    continue
+                column_counts, bin_edges, has_nans = counts[attr]
+                if has_nans:
+                    ldf._message.add_unique(
+                        f"The column <code>{attr}</code> contains missing values, not shown in the displayed histogram.",
+                        priority=100,
+                    )
+                binned_result = np.array([bin_edges[0:-1], column_counts]).T
+                vis._vis_data = pd.DataFrame(binned_result, columns=[attr, "Number of Records"])
+                batched.add(id(vis))
+        return batched
+
+    @staticmethod
+    def _histogram_columns(values, bins: int, first=None, last=None) -> list:
+        """
+        Histograms of the rows of a 2D array, each binned by np.histogram over the range of its
+        non-missing values. The missing values are detected in a single vectorized pass, so that only the
+        columns that have any are filtered, and the ranges are passed to np.histogram rather than
+        recomputed by it for every column. The counts themselves are computed one row at a time, since
+        np.histogram bins a row faster than a vectorized pass over all rows does, except for very short rows.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Float array holding a column per row, with missing values as NaN
+        bins : int
+            Number of equal-width bins of each histogram
+        first, last : np.ndarray, optional
+            Min and max of the non-missing values of each column, computed if None
+
+        Returns
+        -------
+        histograms: list
+            (counts, bin_edges, has_nans) of each column, or None for the columns that are left to
+            execute_binning (e.g., without any value, or with infinite values)
+        """
+        import numpy as np
+
+        missing = np.isnan(values)
+        has_nans = missing.any(axis=1)
+        if first is None:
+            with warnings.catch_warnings():
+                # all-NaN columns have a NaN range
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                first = np.nanmin(values, axis=1)
+                last = np.nanmax(values, axis=1)
+        histograms = []
+        for i, column in enumerate(values):
+            if has_nans[i]:
+                column = column[~missing[i]]
+            try:
+                counts, bin_edges = np.histogram(column, bins=bins, range=(first[i], last[i]))
+            except ValueError:
+                # np.histogram rejects ranges that are not finite
+                histograms.append(None)
+                continue
+            histograms.append((counts, bin_edges, bool(has_nans[i])))
+        return histograms
+
     @staticmethod
     def execute_binning(ldf, vis: Vis):
         """
@@ -297,21 +900,256 @@ class PandasExecutor(Executor):
         vis._vis_data = pd.DataFrame(binned_result, columns=[bin_attr, "Number of Records"])
 
     @staticmethod
-    def execute_filter(vis: Vis):
+    def execute_filter(vis: Vis, attributes: list = None):
+        """
+        Apply the filters of a vis to its data. The filters are evaluated on the filtered columns only,
+        and the matching rows are then gathered from each of the columns that the vis needs, so that only
+        the filtered data is copied.
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        attributes : list, optional
+            Columns kept in the filtered data, or all the columns if None
+
+        Returns
+        -------
+        filtered: bool
+            Whether the vis has any filter
+        """
         assert (
             vis.data is not None
         ), "execute_filter assumes input vis.data is populated (if not, populate with LuxDataFrame values)"
         filters = utils.get_filter_specs(vis._inferred_intent)
-
+        positions = None
         if filters:
             # TODO: Need to handle OR logic
-            for filter in filters:
-                vis._vis_data = PandasExecutor.apply_filter(
-                    vis.data, filter.attribute, filter.filter_op, filter.value
-                )
-            return True
+            positions = PandasExecutor.get_filter_positions(
+                vis.data, [(filter.attribute, filter.filter_op, filter.value) for filter in filters]
+            )
+        if positions is None:
+            vis._vis_data = vis.data if attributes is None else vis.data[attributes]
+        elif attributes is None or len(attributes) == 0:
+            vis._vis_data = (
+                vis.data.iloc[positions] if attributes is None else vis.data[attributes].iloc[positions]
+            )
+        else:
+            # gather the matching rows of each column, rather than first copying every row of the projection
+            columns = [vis.data[attribute].take(positions) for attribute in attributes]
+            vis._vis_data = pd.concat(columns, axis=1).__finalize__(vis.data)
+        return bool(filters)
+
+    @staticmethod
+    def get_filter_positions(df: pd.DataFrame, predicates: list):
+        """
+        Positions of the rows of a dataframe that satisfy every filter predicate.
+        The positions are cached on the dataframe, keyed by the predicates and the version of the data,
+        so that the visualizations sharing a filter (and interestingness.get_filtered_size) only
+        evaluate it once.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe to filter on
+        predicates : list
+            List of (attribute, op, value) filter predicates, combined with AND
+
+        Returns
+        -------
+        positions: np.ndarray
+            Sorted positions of the rows satisfying the filters, or None if they keep every row
+        """
+        import numpy as np
+
+        filter_cache = getattr(df, "_filter_cache", None)
+        if filter_cache is None and isinstance(df, LuxDataFrame):
+            from lux.utils.cache import MemoryCache
+
+            df._filter_cache = filter_cache = MemoryCache(FILTER_CACHE_SIZE)
+        data_version = df._sync_data_version() if filter_cache is not None else None
+        key = (PandasExecutor._get_filter_key(predicates), data_version)
+        if filter_cache is not None and key in filter_cache:
+            return filter_cache.get(key)
+        if len(predicates) == 1:
+            attribute, op, val = predicates[0]
+            positions = PandasExecutor._lookup_value_index(df, attribute, op, val)
+            if positions is None:
+                positions = PandasExecutor._lookup_sort_index(df, attribute, op, val)
+            if positions is None:
+                mask = PandasExecutor._get_filter_mask(df, attribute, op, val)
+                positions = None if mask is None else np.flatnonzero(mask)
+        else:
+            positions = None
+            for predicate in predicates:
+                predicate_positions = PandasExecutor.get_filter_positions(df, [predicate])
+                if predicate_positions is None:
+                    continue
+                if positions is None:
+                    positions = predicate_positions
+                else:
+                    positions = np.intersect1d(positions, predicate_positions, assume_unique=True)
+        if filter_cache is not None:
+            filter_cache.put(key, positions)
+        return positions
+
+    @staticmethod
+    def _lookup_value_index(df: pd.DataFrame, attribute: str, op: str, val: object):
+        """
+        Positions of the rows satisfying a filter, looked up from the value index of the filtered column
+        (see compute_value_index), or None if the column is not indexed or the filter cannot be looked up.
+        """
+        import numpy as np
+
+        value_index = getattr(df, "_value_index", None)
+        if not value_index or attribute not in value_index:
+            return None
+        positions_by_value, nan_positions = value_index[attribute]
+        if utils.like_nan(val):
+            if op == "=":
+                return nan_positions
+            elif op == "!=":
+                selected = list(positions_by_value.values())
+            else:
+                # filters on NaN with other operations are left to warn and scan the column
+                return None
+        elif op == "=":
+            try:
+                return positions_by_value.get(val, nan_positions[0:0])
+            except TypeError:
+                # unhashable values are left to the scan
+                return None
+        elif op == "!=":
+            # like the scan, rows with a missing value are different from any value
+            selected = [positions for value, positions in positions_by_value.items() if value != val]
+            selected.append(nan_positions)
+        elif op in ["<", ">", "<=", ">="]:
+            if pd.api.types.is_categorical_dtype(df[attribute]):
+                # the ordering of categorical columns follows their categories rather than their values
+                return None
+            compare = {
+                "<": lambda value: value < val,
+                ">": lambda value: value > val,
+                "<=": lambda value: value <= val,
+                ">=": lambda value: value >= val,
+            }[op]
+            try:
+                selected = [
+                    positions for value, positions in positions_by_value.items() if compare(value)
+                ]
+            except TypeError:
+                # values that cannot be compared raise the same error when scanning the column
+                return None
         else:
-            return False
+            return None
+        if not selected:
+            return nan_positions[0:0]
+        return np.sort(np.concatenate(selected))
+
+    @staticmethod
+    def get_filter_count(df: pd.DataFrame, predicates: list) -> int:
+        """
+        Number of rows of a dataframe that satisfy every filter predicate. Range filters on a sorted column
+        (see _search_sort_index) are counted without gathering the positions of their rows.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe to filter on
+        predicates : list
+            List of (attribute, op, value) filter predicates, combined with AND
+
+        Returns
+        -------
+        count: int
+            Number of rows satisfying the filters
+        """
+        if len(predicates) == 1:
+            span = PandasExecutor._search_sort_index(df, *predicates[0], build=False)
+            if span is not None:
+                _, start, stop = span
+                return stop - start
+        positions = PandasExecutor.get_filter_positions(df, predicates)
+        return len(df) if positions is None else len(positions)
+
+    @staticmethod
+    def _search_sort_index(df: pd.DataFrame, attribute: str, op: str, val: object, build: bool = True):
+        """
+        Binary search of a range filter in the sort index of a numeric column, which holds its non-missing
+        values in sorted order along with their row positions. The index of a column is lazily built once
+        it has been range filtered SORT_INDEX_MIN_FILTERS times (counted in `_sort_index_filters`), since
+        sorting costs more than a single scan.
+        If `build` is False, the filter is neither counted nor used to build the index.
+
+        Returns
+        -------
+        (order, start, stop): Tuple[np.ndarray, int, int]
+            Row positions of the column in the order of its sorted values, along with the range of these
+            positions that satisfy the filter, or None if the filter is not answered by a sort index
+        """
+        import numpy as np
+
+        if not isinstance(df, LuxDataFrame) or op not in ["<", ">", "<=", ">="]:
+            return None
+        if not isinstance(val, (int, float, np.integer, np.floating)) or isinstance(val, bool):
+            return None
+        if utils.like_nan(val) or attribute not in df.columns or not df.columns.is_unique:
+            return None
+        series = df[attribute]
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            return None
+        # the sort index is dropped along with the metadata whenever the data is mutated
+        df._sync_data_version()
+        if getattr(df, "_sort_index", None) is None:
+            df._sort_index = {}
+            df._sort_index_filters = {}
+        if attribute not in df._sort_index:
+            if not build:
+                return None
+            num_filters = df._sort_index_filters.get(attribute, 0) + 1
+            if num_filters < SORT_INDEX_MIN_FILTERS:
+                df._sort_index_filters[attribute] = num_filters
+                return None
+            df._sort_index_filters.pop(attribute, None)
+            if pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+                values = series.to_numpy()
+            else:
+                values = series.to_numpy(dtype="float64", na_value=np.nan)
+            order = np.argsort(values)
+            # missing values are sorted last, and never satisfy a range filter
+            num_valid = len(values) - int(np.count_nonzero(pd.isna(values)))
+            order = order[:num_valid].astype(np.int32 if len(values) < 2**31 else np.int64)
+            df._sort_index[attribute] = (values[order], order)
+        sorted_values, order = df._sort_index[attribute]
+        if op == "<":
+            return order, 0, int(np.searchsorted(sorted_values, val, side="left"))
+        elif op == "<=":
+            return order, 0, int(np.searchsorted(sorted_values, val, side="right"))
+        elif op == ">":
+            return order, int(np.searchsorted(sorted_values, val, side="right")), len(order)
+        else:
+            return order, int(np.searchsorted(sorted_values, val, side="left")), len(order)
+
+    @staticmethod
+    def _lookup_sort_index(df: pd.DataFrame, attribute: str, op: str, val: object):
+        """
+        Positions of the rows satisfying a range filter, looked up from the sort index of the filtered column
+        (see _search_sort_index), or None if the filter is not answered by a sort index.
+        """
+        import numpy as np
+
+        span = PandasExecutor._search_sort_index(df, attribute, op, val)
+        if span is None:
+            return None
+        order, start, stop = span
+        if (stop - start) * SORT_INDEX_GATHER_RATIO > len(df):
+            return None
+        return np.sort(order[start:stop])
+
+    @staticmethod
+    def _get_filter_key(predicates: list) -> tuple:
+        # filter values may be unhashable, so they are identified by their type and representation
+        return tuple((attribute, op, type(val).__name__, repr(val)) for attribute, op, val in predicates)
 
     @staticmethod
     def apply_filter(df: pd.DataFrame, attribute: str, op: str, val: object) -> pd.DataFrame:
@@ -334,32 +1172,166 @@ class PandasExecutor(Executor):
         df: pandas.DataFrame
             Dataframe resulting from the filter operation
         """
+        positions = PandasExecutor.get_filter_positions(df, [(attribute, op, val)])
+        if positions is None:
+            return df
+        return df.iloc[positions]
+
+    @staticmethod
+    def _get_filter_mask(df: pd.DataFrame, attribute: str, op: str, val: object):
+        """
+        Boolean mask of the rows satisfying a filter, or None for an unknown operation that keeps every row.
+        """
         # Handling NaN filter values
         if utils.like_nan(val):
             if op != "=" and op != "!=":
                 warnings.warn("Filter on NaN must be used with equality operations (i.e., `=` or `!=`)")
             else:
                 if op == "=":
-                    return df[df[attribute].isna()]
+                    return df[attribute].isna().values
                 elif op == "!=":
-                    return df[~df[attribute].isna()]
+                    return ~df[attribute].isna().values
         # Applying filter in regular, non-NaN cases
         if op == "=":
-            return df[df[attribute] == val]
+            mask = df[attribute] == val
         elif op == "<":
-            return df[df[attribute] < val]
+            mask = df[attribute] < val
         elif op == ">":
-            return df[df[attribute] > val]
+            mask = df[attribute] > val
         elif op == "<=":
-            return df[df[attribute] <= val]
+            mask = df[attribute] <= val
         elif op == ">=":
-            return df[df[attribute] >= val]
+            mask = df[attribute] >= val
         elif op == "!=":
-            return df[df[attribute] != val]
-        return df
+            mask = df[attribute] != val
+        else:
+            return None
+        # comparisons of nullable columns are missing on missing values, which (like pandas) do not match
+        return mask.to_numpy(dtype=bool, na_value=False)
 
     @staticmethod
     def execute_2D_binning(vis: Vis):
+        """
+        Bin a scatterplot into a heatmap of lux.config.heatmap_bin_size x lux.config.heatmap_bin_size cells,
+        with the same bins as pd.cut. The cells are counted (and their color aggregated) with np.bincount
+        over the bin of each point, falling back to a groupby over pd.cut intervals for the attributes that
+        cannot be binned this way (e.g., temporal colors).
+
+        Parameters
+        ----------
+        vis: lux.Vis
+            lux.Vis object that represents a visualization
+        """
+        result = PandasExecutor._bincount_2D(vis)
+        if result is not None:
+            vis._vis_data = result
+        else:
+            PandasExecutor._groupby_2D_binning(vis)
+
+    @staticmethod
+    def _bincount_2D(vis: Vis):
+        """
+        Heatmap cells of a scatterplot, counted with np.bincount, or None if its attributes are not supported.
+
+        Returns
+        -------
+        result: lux.core.frame
+            Count (and color) of the non-empty cells along with their bins, in the same layout as the
+            groupby over pd.cut intervals (including the position of each cell in the grid as its index)
+        """
+        import numpy as np
+
+        data = vis._vis_data
+        bin_size = lux.config.heatmap_bin_size
+        x_attr = vis.get_attr_by_channel("x")[0].attribute
+        y_attr = vis.get_attr_by_channel("y")[0].attribute
+        color_attr = vis.get_attr_by_channel("color")
+        color_attr = color_attr[0] if len(color_attr) > 0 else None
+        for attr in [x_attr, y_attr]:
+            dtype = data[attr].dtype
+            if not (pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)):
+                return None
+        x_codes, x_bins = PandasExecutor._cut_codes(vis, x_attr, bin_size)
+        y_codes, y_bins = PandasExecutor._cut_codes(vis, y_attr, bin_size)
+        num_cells = bin_size * bin_size
+        cells = x_codes * bin_size + y_codes
+        binned = (x_codes >= 0) & (y_codes >= 0)
+        if color_attr is None:
+            counts = np.bincount(cells[binned], minlength=num_cells)
+            result = LuxDataFrame({"count": counts})
+            result = result[result["count"] != 0]
+        else:
+            color = data[color_attr.attribute]
+            if color_attr.data_type == "nominal":
+                try:
+                    # sorted codes break ties towards the smallest category, like the first value of Series.mode
+                    color_codes, categories = pd.factorize(color, sort=True)
+                except TypeError:
+                    return None
+                counted = binned & (color_codes >= 0)
+                num_categories = max(len(categories), 1)
+                votes = np.bincount(
+                    cells[counted] * num_categories + color_codes[counted],
+                    minlength=num_cells * num_categories,
+                ).reshape(num_cells, num_categories)
+                counts = votes.sum(axis=1)
+                majority = pd.Series(categories).reindex(votes.argmax(axis=1)).values
+                color_values = pd.Series(majority).where(counts > 0)
+            elif color_attr.data_type == "quantitative" and pd.api.types.is_numeric_dtype(color.dtype):
+                values = color.to_numpy(dtype="float64", na_value=np.nan)
+                counted = binned & ~np.isnan(values)
+                counts = np.bincount(cells[counted], minlength=num_cells)
+                sums = np.bincount(cells[counted], weights=values[counted], minlength=num_cells)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    color_values = sums / counts
+            else:
+                return None
+            # cells without any colored point have a missing color, and are dropped like by the groupby
+            result = LuxDataFrame({"count": counts, color_attr.attribute: color_values}).dropna()
+        x_cells, y_cells = np.divmod(result.index.values, bin_size)
+        result["xBinStart"] = x_bins.left.values[x_cells].astype("float")
+        result["xBinEnd"] = x_bins.right.values[x_cells]
+        result["yBinStart"] = y_bins.left.values[y_cells].astype("float")
+        result["yBinEnd"] = y_bins.right.values[y_cells]
+        return result
+
+    @staticmethod
+    def _cut_codes(vis: Vis, attr, bin_size: int):
+        """
+        Bin of each value of a numeric attribute, with the same bins as pd.cut.
+
+        Returns
+        -------
+        (codes, intervals): Tuple[np.ndarray, pd.IntervalIndex]
+            Bin of each row (-1 for missing values), along with the intervals of the bins
+        """
+        import numpy as np
+
+        values = vis._vis_data[attr].to_numpy(dtype="float64", na_value=np.nan)
+        source = vis._source
+        if (
+            source is not None
+            and source._min_max
+            and attr in source._min_max
+            and len(source) == len(values)
+            and not utils.get_filter_specs(vis._inferred_intent)
+        ):
+            # the vis holds every row of the dataframe, whose min/max were precomputed with the metadata
+            min_max = list(source._min_max[attr])
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                min_max = [np.nanmin(values), np.nanmax(values)] if len(values) else []
+        # the bins only depend on the range of the values, so that they are cut from the min/max alone
+        intervals, bins = pd.cut(pd.Series(min_max, dtype="float64"), bins=bin_size, retbins=True)
+        # right-closed bins, whose first edge was lowered by pd.cut to include the min
+        ids = np.searchsorted(bins, values, side="left")
+        codes = ids - 1
+        codes[(ids == 0) | (ids == len(bins))] = -1
+        return codes, intervals.cat.categories
+
+    @staticmethod
+    def _groupby_2D_binning(vis: Vis):
         pd.reset_option("mode.chained_assignment")
         with pd.option_context("mode.chained_assignment", None):
             x_attr = vis.get_attr_by_channel("x")[0].attribute
@@ -401,76 +1373,104 @@ class PandasExecutor(Executor):
 
             vis._vis_data = result.drop(columns=["xBin", "yBin"])
 
+    @staticmethod
+    def execute_correlation(ldf: LuxDataFrame, attributes: list, filters: list = None):
+        """
+        Pearson correlation between every pair of quantitative attributes over the rows of the (sampled) data
+        satisfying the filters, computed at once with np.corrcoef rather than one scatterplot at a time.
+        Like scipy.stats.pearsonr over the rows of a scatterplot, each pair is correlated over the rows where
+        both of its attributes are present, and is undefined if either attribute is constant.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame with specified intent.
+        attributes : list
+            Quantitative attributes to correlate
+        filters : list, optional
+            Filter clauses shared by the scatterplots of the attributes
+
+        Returns
+        -------
+        (correlation, num_rows): Tuple[np.ndarray, int]
+            Correlation between the i-th and j-th attributes (NaN if undefined), along with the number of
+            rows satisfying the filters
+        """
+        import numpy as np
+
+        PandasExecutor.execute_sampling(ldf)
+        data = ldf._sampled
+        positions = None
+        if filters:
+            positions = PandasExecutor.get_filter_positions(
+                data, [(filter.attribute, filter.filter_op, filter.value) for filter in filters]
+            )
+        columns = []
+        for attr in attributes:
+            values = data[attr].to_numpy(dtype="float64", na_value=np.nan)
+            columns.append(values if positions is None else values[positions])
+        values = np.column_stack(columns) if columns else np.empty((len(data), 0))
+        num_rows = len(values)
+        missing = np.isnan(values)
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if num_rows > 0:
+                constant = ~(np.nanmax(values, axis=0) > np.nanmin(values, axis=0))
+            else:
+                constant = np.ones(len(attributes), dtype=bool)
+            if not missing.any():
+                correlation = np.corrcoef(values, rowvar=False).reshape(len(attributes), len(attributes))
+            else:
+                # pairwise-complete moments, from products of the (centered) values masked by their presence
+                present = (~missing).astype("float64")
+                values = np.where(missing, 0, values - np.nanmean(values, axis=0))
+                counts = present.T @ present
+                # sums[i, j] is the sum of the i-th attribute over the rows where the j-th one is present
+                sums = values.T @ present
+                squares = (values**2).T @ present
+                covariance = values.T @ values - sums * sums.T / counts
+                variance = squares - sums**2 / counts
+                correlation = covariance / np.sqrt(variance * variance.T)
+                correlation[counts < 2] = np.nan
+        correlation[constant, :] = np.nan
+        correlation[:, constant] = np.nan
+        return np.clip(correlation, -1, 1), num_rows
+
     #######################################################
     ############ Metadata: data type, model #############
     #######################################################
-    def compute_dataset_metadata(self, ldf: LuxDataFrame):
-        ldf._data_type = {}
-        self.compute_data_type(ldf)
+    def compute_dataset_metadata(self, ldf: LuxDataFrame, attributes: list = None):
+        if attributes is None:
+            ldf._data_type = {}
+            ldf._datetime_lookups = {}
+        elif ldf._datetime_lookups is None:
+            ldf._datetime_lookups = {}
+        self.compute_data_type(ldf, attributes)
 
-    def compute_data_type(self, ldf: LuxDataFrame):
+    def compute_data_type(self, ldf: LuxDataFrame, attributes: list = None):
         from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
-        for attr in list(ldf.columns):
-            if attr in ldf._type_override:
-                ldf._data_type[attr] = ldf._type_override[attr]
-            else:
-                temporal_var_list = ["month", "year", "day", "date", "time", "weekday"]
-                if is_datetime(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_datetime_string(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
-                    ldf._data_type[attr] = "temporal"
-                elif str(attr).lower() in temporal_var_list:
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_datetime_number(ldf[attr]):
-                    ldf._data_type[attr] = "temporal"
-                elif self._is_geographical_attribute(ldf[attr]):
-                    ldf._data_type[attr] = "geographical"
-                elif pd.api.types.is_float_dtype(ldf.dtypes[attr]):
-
-                    if ldf.cardinality[attr] != len(ldf) and (ldf.cardinality[attr] < 20):
-                        ldf._data_type[attr] = "nominal"
-                    else:
-                        ldf._data_type[attr] = "quantitative"
-                elif pd.api.types.is_integer_dtype(ldf.dtypes[attr]):
-                    # See if integer value is quantitative or nominal by checking if the ratio of cardinality/data size is less than 0.4 and if there are less than 10 unique values
-                    if ldf.pre_aggregated:
-                        if ldf.cardinality[attr] == len(ldf):
-                            ldf._data_type[attr] = "nominal"
-                    if ldf.cardinality[attr] / len(ldf) < 0.4 and ldf.cardinality[attr] < 20:
-                        ldf._data_type[attr] = "nominal"
-                    else:
-                        ldf._data_type[attr] = "quantitative"
-                    if check_if_id_like(ldf, attr):
-                        ldf._data_type[attr] = "id"
-                # Eliminate this clause because a single NaN value can cause the dtype to be object
-                elif pd.api.types.is_string_dtype(ldf.dtypes[attr]):
-                    # Check first if it's castable to float after removing NaN
-                    is_numeric_nan, series = is_numeric_nan_column(ldf[attr])
-                    if is_numeric_nan:
-                        # int columns gets coerced into floats if contain NaN
-                        ldf._data_type[attr] = "quantitative"
-                        # min max was not computed since object type, so recompute here
-                        ldf._min_max[attr] = (
-                            series.min(),
-                            series.max(),
-                        )
-                    elif check_if_id_like(ldf, attr):
-                        ldf._data_type[attr] = "id"
-                    else:
-                        ldf._data_type[attr] = "nominal"
-                # check if attribute is any type of datetime dtype
-                elif is_datetime_series(ldf.dtypes[attr]):
-                    ldf._data_type[attr] = "temporal"
-                else:
-                    ldf._data_type[attr] = "nominal"
+        # look up dtypes once, rather than rebuilding the dtypes Series for every column
+        dtypes = ldf.dtypes
+        if attributes is None:
+            attributes = list(ldf.columns)
+        # access the columns up front, so that the threads below do not race to populate the column cache
+        columns = [ldf[attr] for attr in attributes]
+
+        def infer_data_type(i):
+            attr = attributes[i]
+            return self._infer_data_type(ldf, attr, columns[i], dtypes[attr])
+
+        results = PandasExecutor._map_columns(infer_data_type, range(len(attributes)))
+        for attr, (data_type, min_max) in zip(attributes, results):
+            ldf._data_type[attr] = data_type
+            if min_max is not None:
+                ldf._min_max[attr] = min_max
         if not pd.api.types.is_integer_dtype(ldf.index) and ldf.index.name:
             ldf._data_type[ldf.index.name] = "nominal"
 
         non_datetime_attrs = []
-        for attr in ldf.columns:
+        for attr in attributes:
             if ldf._data_type[attr] == "temporal" and not is_datetime(ldf[attr]):
                 non_datetime_attrs.append(attr)
         warn_msg = ""
@@ -487,23 +1487,125 @@ class PandasExecutor(Executor):
             warn_msg += f"\n\tdf.set_data_type({{'{attr}':'quantitative'}})"
             warnings.warn(warn_msg, stacklevel=2)
 
+    def _infer_data_type(self, ldf: LuxDataFrame, attr, series: pd.Series, dtype):
+        """
+        Infer the data type of a single column, independently of the other columns.
+
+        Returns
+        -------
+        (data_type, min_max): Tuple[str, tuple]
+            Inferred data type of the column, along with its min/max if it had to be recomputed
+            (e.g., for numeric columns stored as strings), or None otherwise.
+        """
+        from pandas.api.types import is_datetime64_any_dtype as is_datetime
+
+        if attr in ldf._type_override:
+            return ldf._type_override[attr], None
+        temporal_var_list = ["month", "year", "day", "date", "time", "weekday"]
+        if is_datetime(series):
+            return "temporal", None
+        elif self._is_datetime_string(series, ldf._datetime_lookups):
+            return "temporal", None
+        elif isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
+            return "temporal", None
+        elif str(attr).lower() in temporal_var_list:
+            return "temporal", None
+        elif self._is_datetime_number(series):
+            return "temporal", None
+        elif self._is_geographical_attribute(series):
+            return "geographical", None
+        elif pd.api.types.is_float_dtype(dtype):
+            if ldf.cardinality[attr] != len(ldf) and (ldf.cardinality[attr] < 20):
+                return "nominal", None
+            else:
+                return "quantitative", None
+        elif pd.api.types.is_integer_dtype(dtype):
+            # See if integer value is quantitative or nominal by checking if the ratio of cardinality/data size is less than 0.4 and if there are less than 10 unique values
+            if ldf.cardinality[attr] / len(ldf) < 0.4 and ldf.cardinality[attr] < 20:
+                data_type = "nominal"
+            else:
+                data_type = "quantitative"
+            if check_if_id_like(ldf, attr):
+                data_type = "id"
+            return data_type, None
+        # Eliminate this clause because a single NaN value can cause the dtype to be object
+        elif pd.api.types.is_string_dtype(dtype):
+            # Check first if it's castable to float after removing NaN
+            is_numeric_nan, numeric_series = is_numeric_nan_column(series)
+            if is_numeric_nan:
+                # int columns gets coerced into floats if contain NaN
+                # min max was not computed since object type, so recompute here
+                return "quantitative", (numeric_series.min(), numeric_series.max())
+            elif check_if_id_like(ldf, attr):
+                return "id", None
+            else:
+                return "nominal", None
+        # check if attribute is any type of datetime dtype
+        elif is_datetime_series(dtype):
+            return "temporal", None
+        else:
+            return "nominal", None
+
+    @staticmethod
+    def _map_columns(func, items) -> list:
+        """
+        Apply a function to the items of every column, fanning the calls out over a pool of
+        lux.config.metadata_threads threads. Most of the underlying NumPy and Pandas kernels release
+        the GIL, so that the per-column work runs in parallel.
+        """
+        num_threads = lux.config.metadata_threads
+        items = list(items)
+        if num_threads <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(num_threads, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    @staticmethod
+    def _type_inference_sample(series, sample_size: int = 1000):
+        """
+        Stratified sample of the non-null values of a series used for type inference, picking one
+        random row from each of `sample_size` equally sized strata so that the whole column is covered.
+        """
+        import numpy as np
+
+        if len(series) > sample_size:
+            strata = np.linspace(0, len(series), sample_size + 1).astype(np.int64)
+            offsets = np.random.RandomState(0).randint(0, np.diff(strata))
+            series = series.iloc[strata[:-1] + offsets]
+        return series.dropna()
+
     @staticmethod
-    def _is_datetime_string(series):
+    def _is_datetime_string(series, datetime_lookups: dict = None):
+        """
+        Check whether an object column holds datetime strings. A stratified sample decides the columns that
+        are not datetimes (numeric strings, or values that fail to parse), while a sample that parses as
+        datetimes is confirmed on every distinct value of the column, since values outside of the sample may
+        not parse. The datetimes parsed by the confirmation are kept in datetime_lookups, by column, so that
+        temporal charts can reuse them.
+        """
         if series.dtype == object:
-            not_numeric = False
+            sample = PandasExecutor._type_inference_sample(series)
+            # a sample without any non-null value is ambiguous, so the full column is checked instead
+            values = sample if len(sample) > 0 else series
             try:
-                pd.to_numeric(series)
+                pd.to_numeric(values)
+                return False
             except Exception as e:
-                not_numeric = True
-
-            datetime_col = None
-            if not_numeric:
-                try:
-                    datetime_col = pd.to_datetime(series)
-                except Exception as e:
-                    return False
-            if datetime_col is not None:
-                return True
+                pass
+            try:
+                pd.to_datetime(values)
+            except Exception as e:
+                return False
+            try:
+                distinct_values = pd.unique(series.dropna())
+                datetimes = pd.to_datetime(distinct_values)
+            except Exception as e:
+                return False
+            if datetime_lookups is not None:
+                datetime_lookups[series.name] = pd.Series(datetimes, index=distinct_values)
+            return True
         return False
 
     @staticmethod
@@ -517,40 +1619,333 @@ class PandasExecutor(Executor):
         is_int_dtype = pd.api.types.is_integer_dtype(series.dtype)
         if is_int_dtype:
             try:
-                temp = series.astype(str)
-                pd.to_datetime(temp)
+                # only the distinct values of the columns whose sample parses as datetimes are all parsed
+                pd.to_datetime(PandasExecutor._type_inference_sample(series).astype(str))
+                pd.to_datetime(pd.unique(series).astype(str))
                 return True
             except Exception:
                 return False
         return False
 
-    def compute_stats(self, ldf: LuxDataFrame):
+    def compute_stats(self, ldf: LuxDataFrame, attributes: list = None):
         # precompute statistics
-        ldf.unique_values = {}
-        ldf._min_max = {}
-        ldf.cardinality = {}
         ldf._length = len(ldf)
+        if attributes is None:
+            ldf.unique_values = {}
+            ldf._min_max = {}
+            ldf.cardinality = {}
+            ldf._column_stats = PandasExecutor.compute_column_stats(ldf)
+        else:
+            # only refresh the statistics of the given columns, keeping those of the other columns
+            ldf._column_stats.update(PandasExecutor.compute_column_stats(ldf, attributes))
+        unique_values_cap = lux.config.unique_values_cap
+        sketch_threshold = lux.config.cardinality_sketch_threshold
+        use_sketch = bool(sketch_threshold) and len(ldf) > sketch_threshold
+        exact_cardinality_limit = unique_values_cap or EXACT_CARDINALITY_LIMIT
+
+        attrs = list(ldf.columns if attributes is None else attributes)
+        # access the columns up front, so that the threads below do not race to populate the column cache
+        columns = [ldf[attribute] for attribute in attrs]
 
-        for attribute in ldf.columns:
+        def compute_unique_values(i):
+            return PandasExecutor._compute_unique_values(columns[i], use_sketch, exact_cardinality_limit)
 
+        results = PandasExecutor._map_columns(compute_unique_values, range(len(attrs)))
+        for attribute, (cardinality, unique_values) in zip(attrs, results):
             if isinstance(attribute, pd._libs.tslibs.timestamps.Timestamp):
                 # If timestamp, make the dictionary keys the _repr_ (e.g., TimeStamp('2020-04-05 00.000')--> '2020-04-05')
                 attribute_repr = str(attribute._date_repr)
             else:
                 attribute_repr = attribute
 
-            ldf.unique_values[attribute_repr] = list(ldf[attribute].unique())
-            ldf.cardinality[attribute_repr] = len(ldf.unique_values[attribute_repr])
+            column_stats = ldf._column_stats[attribute]
+            if "min_max" in column_stats:
+                ldf._min_max[attribute_repr] = column_stats["min_max"]
+            ldf.cardinality[attribute_repr] = cardinality
+            ldf.unique_values[attribute_repr] = unique_values
+        PandasExecutor.compute_value_index(ldf, attributes)
+        PandasExecutor.compute_data_cube(ldf, attributes)
 
-            if pd.api.types.is_float_dtype(ldf.dtypes[attribute]) or pd.api.types.is_integer_dtype(
-                ldf.dtypes[attribute]
-            ):
-                ldf._min_max[attribute_repr] = (
-                    ldf[attribute].min(),
-                    ldf[attribute].max(),
-                )
-
-        if not pd.api.types.is_integer_dtype(ldf.index):
+        if attributes is None and not pd.api.types.is_integer_dtype(ldf.index):
             index_column_name = ldf.index.name
-            ldf.unique_values[index_column_name] = list(ldf.index)
+            if unique_values_cap and len(ldf.index) > unique_values_cap:
+                # Summarize the index by its most frequent values, like the other high-cardinality columns
+                value_counts = ldf.index.value_counts(dropna=False).nlargest(unique_values_cap)
+                ldf.unique_values[index_column_name] = list(value_counts.index)
+            else:
+                ldf.unique_values[index_column_name] = list(ldf.index)
             ldf.cardinality[index_column_name] = len(ldf.index)
+
+    @staticmethod
+    def compute_value_index(ldf: LuxDataFrame, attributes: list = None, cardinality: dict = None):
+        """
+        Index the row positions of every value of the columns with at most lux.config.value_index_cardinality
+        unique values, so that filters on them look up their rows instead of scanning the column.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose columns are indexed
+        attributes : list, optional
+            Columns to (re)index, keeping the index of the other columns. All columns are indexed if None.
+        cardinality : dict, optional
+            Cardinality of the columns, defaults to the cardinality metadata of the ldf
+        """
+        max_cardinality = lux.config.value_index_cardinality
+        if not max_cardinality:
+            ldf._value_index = None
+            return
+        if cardinality is None:
+            cardinality = ldf.cardinality
+        if attributes is None or ldf._value_index is None:
+            ldf._value_index = {}
+            attributes = ldf.columns
+        if not ldf.columns.is_unique:
+            # columns are indexed by name, which is ambiguous for duplicated columns
+            return
+        for attribute in attributes:
+            ldf._value_index.pop(attribute, None)
+            series = ldf[attribute]
+            if (cardinality or {}).get(attribute, max_cardinality + 1) > max_cardinality:
+                continue
+            # scans of datetime columns also match the strings that parse to their values
+            if is_datetime_series(series) or pd.api.types.is_timedelta64_dtype(series):
+                continue
+            try:
+                ldf._value_index[attribute] = PandasExecutor._build_value_index(series)
+            except TypeError:
+                # columns of unhashable values (e.g., lists) are not indexed
+                pass
+
+    @staticmethod
+    def compute_data_cube(ldf: LuxDataFrame, attributes: list = None, cardinality: dict = None):
+        """
+        Precompute the number of rows of each value of the columns with at most
+        lux.config.data_cube_cardinality unique values, along with the contingency tables of every pair of
+        these columns, so that the bar charts counting Records over them are looked up instead of grouped.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose counts are precomputed
+        attributes : list, optional
+            Columns whose counts (and contingency tables) are recomputed, keeping those of the other columns.
+            The counts of all columns are computed if None.
+        cardinality : dict, optional
+            Cardinality of the columns, defaults to the cardinality metadata of the ldf
+        """
+        import numpy as np
+
+        max_cardinality = lux.config.data_cube_cardinality
+        if not max_cardinality or not ldf.columns.is_unique:
+            # columns are looked up by name, which is ambiguous for duplicated columns
+            ldf._data_cube = None
+            return
+        if cardinality is None:
+            cardinality = ldf.cardinality or {}
+        if attributes is None or ldf._data_cube is None:
+            ldf._data_cube = {"columns": {}, "pairs": {}}
+            attributes = ldf.columns
+        cube = ldf._data_cube
+        for attribute in attributes:
+            cube["columns"].pop(attribute, None)
+        cube["pairs"] = {
+            pair: counts
+            for pair, counts in cube["pairs"].items()
+            if pair[0] not in attributes and pair[1] not in attributes
+        }
+        eligible = [
+            attr
+            for attr in ldf.columns
+            if cardinality.get(attr, max_cardinality + 1) <= max_cardinality
+            # categorical columns are grouped by all of their categories, including those that do not occur
+            and not pd.api.types.is_categorical_dtype(ldf[attr])
+        ]
+        codes = {}
+        for attr in eligible:
+            try:
+                attr_codes, uniques = pd.factorize(ldf[attr])
+            except TypeError:
+                # columns of unhashable values (e.g., lists) are not counted
+                continue
+            # shift the codes by one so that missing values (coded as -1) get the first slot
+            attr_codes = attr_codes + 1
+            codes[attr] = (attr_codes, len(uniques) + 1)
+            if attr in attributes:
+                # the first row of each slot holds its value, so that the values keep the dtype of the column
+                first_rows = np.zeros(len(uniques) + 1, dtype=np.int64)
+                first_rows[attr_codes[::-1]] = np.arange(len(attr_codes))[::-1]
+                cube["columns"][attr] = {
+                    "values": ldf[attr].iloc[first_rows],
+                    "slots": {value: slot + 1 for slot, value in enumerate(uniques)},
+                    "counts": np.bincount(attr_codes, minlength=len(uniques) + 1),
+                }
+        counted = list(codes)
+        for i, attr in enumerate(counted):
+            for other in counted[i + 1 :]:
+                if attr not in attributes and other not in attributes:
+                    continue
+                attr_codes, num_slots = codes[attr]
+                other_codes, num_other_slots = codes[other]
+                counts = np.bincount(
+                    attr_codes * num_other_slots + other_codes, minlength=num_slots * num_other_slots
+                )
+                cube["pairs"][(attr, other)] = counts.reshape(num_slots, num_other_slots)
+
+    @staticmethod
+    def _build_value_index(series: pd.Series):
+        """
+        Row positions of each value of a column.
+
+        Returns
+        -------
+        (positions_by_value, nan_positions): Tuple[dict, np.ndarray]
+            Sorted row positions of each non-missing value, along with those of the missing values
+        """
+        import numpy as np
+
+        codes, uniques = pd.factorize(series)
+        dtype = np.int32 if len(series) < 2**31 else np.int64
+        # a stable sort keeps the positions of each value sorted, and is a linear radix sort on small codes
+        order = np.argsort(codes, kind="stable").astype(dtype)
+        counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+        groups = np.split(order, np.cumsum(counts)[:-1])
+        # missing values are coded as -1, so their positions come first
+        return dict(zip(uniques, groups[1:])), groups[0]
+
+    @staticmethod
+    def _compute_unique_values(series: pd.Series, use_sketch: bool, exact_cardinality_limit: int):
+        """
+        Compute the cardinality and unique values of a single column, independently of the other columns.
+
+        Returns
+        -------
+        (cardinality, unique_values): Tuple[int, list]
+            Number of distinct values of the column, along with its unique values (or a summary of its
+            most frequent values, for high-cardinality columns)
+        """
+        unique_values_cap = lux.config.unique_values_cap
+        if use_sketch:
+            # Estimate the cardinality first, and only materialize the exact unique values when
+            # they are few enough to be stored in full (e.g., for the nominal type thresholds)
+            estimate = approx_cardinality(series, lux.config.cardinality_sketch_error)
+            if estimate > exact_cardinality_limit:
+                value_counts = PandasExecutor._sample_value_counts(series)
+                unique_values = list(value_counts.nlargest(exact_cardinality_limit).index)
+                return max(int(round(estimate)), len(unique_values) + 1), unique_values
+        if unique_values_cap:
+            # Count the values in a single pass, which gives the cardinality without a separate unique(),
+            # and only keep a summary of the most frequent values of high-cardinality columns
+            value_counts = series.value_counts(dropna=False)
+            if len(value_counts) > unique_values_cap:
+                return len(value_counts), list(value_counts.nlargest(unique_values_cap).index)
+            return len(value_counts), list(value_counts.index)
+        unique_values = series.unique()
+        return len(unique_values), list(unique_values)
+
+    @staticmethod
+    def _sample_value_counts(series: pd.Series, sample_size: int = 100000) -> pd.Series:
+        """
+        Value counts of a uniform random sample of the series, used to pick the most frequent values
+        of columns whose cardinality is only estimated, without hashing every distinct value.
+        """
+        import numpy as np
+
+        if len(series) > sample_size:
+            positions = np.random.RandomState(0).randint(0, len(series), sample_size)
+            series = series.iloc[positions]
+        return series.value_counts(dropna=False)
+
+    @staticmethod
+    def compute_column_stats(ldf: LuxDataFrame, attributes: list = None) -> dict:
+        """
+        Compute the dtype, the min/max (of numeric columns) and the ID statistics of every column.
+        Rather than reducing each column separately, the min/max are reduced once per homogeneous
+        dtype block of the underlying BlockManager, so that a frame with hundreds of float columns
+        is reduced with a single vectorized call. The unique values and cardinality are computed
+        separately by compute_stats, by hashing each column.
+
+        Parameters
+        ----------
+        ldf : lux.core.frame
+            LuxDataFrame whose column statistics will be computed.
+        attributes : list, optional
+            If specified, only the statistics of these columns are computed, one column at a time.
+
+        Returns
+        -------
+        column_stats: Dict[str, dict]
+            Mapping from each column to a dictionary holding its `dtype`, the statistics of
+            _compute_id_stats and, for integer and float columns, its `min_max` tuple.
+        """
+        import numpy as np
+
+        column_stats = {}
+        if attributes is not None:
+            for attr in attributes:
+                column_stats[attr] = PandasExecutor._compute_series_stats(ldf[attr])
+            return column_stats
+        columns = ldf.columns
+        for block in ldf._mgr.blocks:
+            attrs = columns[block.mgr_locs.indexer]
+            values = block.values
+            is_numeric = pd.api.types.is_float_dtype(block.dtype) or pd.api.types.is_integer_dtype(
+                block.dtype
+            )
+            if isinstance(values, np.ndarray) and values.ndim == 2:
+                is_numeric = is_numeric and values.shape[1] > 0
+                if is_numeric:
+                    with warnings.catch_warnings():
+                        # all-NaN columns result in a NaN min/max, same as Series.min()
+                        warnings.simplefilter("ignore", category=RuntimeWarning)
+                        mins = np.nanmin(values, axis=1)
+                        maxs = np.nanmax(values, axis=1)
+                for i, attr in enumerate(attrs):
+                    stats = {"dtype": block.dtype}
+                    if is_numeric:
+                        stats["min_max"] = (mins[i], maxs[i])
+                    stats.update(PandasExecutor._compute_id_stats(values[i], block.dtype))
+                    column_stats[attr] = stats
+            else:
+                # Extension blocks (e.g., nullable integers, categoricals) hold a single 1D column
+                for attr in attrs:
+                    column_stats[attr] = PandasExecutor._compute_series_stats(ldf[attr])
+        return column_stats
+
+    @staticmethod
+    def _compute_series_stats(series: pd.Series) -> dict:
+        stats = {"dtype": series.dtype}
+        if pd.api.types.is_float_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+            stats["min_max"] = (series.min(), series.max())
+        if series.hasnans and pd.api.types.is_integer_dtype(series.dtype):
+            # nullable integers are never evenly spaced, same as the NaN differences of Series.diff()
+            stats["evenly_spaced"] = False
+        else:
+            stats.update(PandasExecutor._compute_id_stats(series.to_numpy(), series.dtype))
+        return stats
+
+    @staticmethod
+    def _compute_id_stats(values, dtype) -> dict:
+        """
+        Compute the statistics that utils.check_if_id_like relies on to detect ID-like columns,
+        so that the detection does not need another pass over the column.
+
+        Returns
+        -------
+        id_stats: dict
+            For integer columns, whether their values are `evenly_spaced` (e.g., 1, 2, 3, ...).
+            For string columns, the standard deviation of the string lengths (`str_length_std`)
+            of a sample of 50 values, as serial numbers or codes usually have a consistent length.
+        """
+        import numpy as np
+
+        if pd.api.types.is_integer_dtype(dtype):
+            diff = np.diff(np.asarray(values, dtype=np.int64))
+            return {"evenly_spaced": bool(len(diff) == 0 or (diff == diff[0]).all())}
+        elif pd.api.types.is_string_dtype(dtype):
+            if len(values) > 50:
+                # same rows as Series.sample(50, random_state=99)
+                values = values[np.random.RandomState(99).choice(len(values), 50, replace=False)]
+            lengths = pd.Series([len(x) if type(x) == str else 0 for x in values], dtype=float)
+            return {"str_length_std": lengths.std()}
+        return {}
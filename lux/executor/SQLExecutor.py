@@ -5,6 +5,7 @@ from lux.core.sqltable import LuxSQLTable
 from lux.executor.Executor import Executor
 from lux.utils import utils
 from lux.utils.utils import check_import_lux_widget, check_if_id_like
+from lux.utils.sketch import EXACT_CARDINALITY_LIMIT, HyperLogLog
 import lux
 
 import math
@@ -692,7 +693,21 @@ class SQLExecutor(Executor):
         None
         """
         cardinality = {}
+        sketch_threshold = lux.config.cardinality_sketch_threshold
+        use_sketch = False
+        if sketch_threshold:
+            length_query = pandas.read_sql(
+                "SELECT COUNT(1) as length FROM {}".format(tbl.table_name),
+                lux.config.SQLconnection,
+            )
+            use_sketch = list(length_query["length"])[0] > sketch_threshold
         for attr in list(tbl.columns):
+            if use_sketch:
+                # Only run the exact Count(Distinct) when the sketch shows that the column has few values
+                estimate = self.get_approx_cardinality(tbl, attr)
+                if estimate > (lux.config.unique_values_cap or EXACT_CARDINALITY_LIMIT):
+                    cardinality[attr] = int(round(estimate))
+                    continue
             card_query = 'SELECT Count(Distinct("{}")) FROM {} WHERE "{}" IS NOT NULL'.format(
                 attr, tbl.table_name, attr
             )
@@ -703,6 +718,40 @@ class SQLExecutor(Executor):
             cardinality[attr] = list(card_data["count"])[0]
         tbl.cardinality = cardinality
 
+    def get_approx_cardinality(self, tbl: LuxSQLTable, attr: str):
+        """
+        Function which estimates the cardinality of a variable within the specified Lux DataFrame's SQL table.
+        The HyperLogLog registers are computed inside the database from 32-bit hashes of the values,
+        so that only one row per register is transferred.
+
+        Parameters
+        ----------
+        tbl: lux.LuxSQLTable
+            lux.LuxSQLTable object whose metadata will be calculated
+        attr: str
+            Name of the variable whose cardinality is estimated
+
+        Returns
+        -------
+        estimate: float
+            Approximate number of distinct non-null values of the variable
+        """
+        sketch = HyperLogLog(lux.config.cardinality_sketch_error, hash_bits=32)
+        p = sketch.precision
+        q = 32 - p
+        hash_query = 'SELECT hashtext("{}"::text)::bigint & 4294967295 AS h FROM {} WHERE "{}" IS NOT NULL'.format(
+            attr, tbl.table_name, attr
+        )
+        rank_query = "SELECT h >> {} AS register, CASE WHEN (h & {}) = 0 THEN {} ELSE {} - FLOOR(LOG(2, (h & {})::numeric)) END AS rank FROM ({}) AS hashes".format(
+            q, (1 << q) - 1, q + 1, q, (1 << q) - 1, hash_query
+        )
+        register_query = (
+            "SELECT register, MAX(rank) AS rank FROM ({}) AS ranks GROUP BY register".format(rank_query)
+        )
+        register_data = pandas.read_sql(register_query, lux.config.SQLconnection)
+        sketch.add_registers(register_data["register"], register_data["rank"])
+        return sketch.estimate()
+
     def get_unique_values(self, tbl: LuxSQLTable):
         """
         Function which collects the unique values for each variable within the specified Lux DataFrame's SQL table.
@@ -718,10 +767,16 @@ class SQLExecutor(Executor):
         None
         """
         unique_vals = {}
+        unique_values_cap = lux.config.unique_values_cap
         for attr in list(tbl.columns):
             unique_query = 'SELECT Distinct("{}") FROM {} WHERE "{}" IS NOT NULL'.format(
                 attr, tbl.table_name, attr
             )
+            if unique_values_cap and tbl.cardinality[attr] > unique_values_cap:
+                # For high-cardinality columns, only fetch the most frequent values
+                unique_query = 'SELECT "{}" FROM {} WHERE "{}" IS NOT NULL GROUP BY "{}" ORDER BY COUNT(1) DESC LIMIT {}'.format(
+                    attr, tbl.table_name, attr, attr, unique_values_cap
+                )
             unique_data = pandas.read_sql(
                 unique_query,
                 lux.config.SQLconnection,
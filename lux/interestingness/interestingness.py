@@ -27,6 +27,11 @@ from lux.interestingness.similarity import preprocess, euclidean_dist
 from lux.vis.VisList import VisList
 import warnings
 
+# number of vis executed at a time by score_top_k once the top-k is filled
+TOP_K_BATCH_SIZE = 4
+# number of overall (e.g., unfiltered) vis whose data is kept per dataframe, see execute_cached
+OVERALL_CACHE_SIZE = 64
+
 
 def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
     """
@@ -46,6 +51,10 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
     if vis.data is None or len(vis.data) == 0:
         return -1
         # raise Exception("Vis.data needs to be populated before interestingness can be computed. Run Executor.execute(vis,ldf).")
+    # reuse the score of an identical recommended vis whose columns have not changed since
+    cached_vis = ldf._get_cached_vis(vis)
+    if cached_vis is not None:
+        return cached_vis["score"]
     try:
         filter_specs = utils.get_filter_specs(vis._inferred_intent)
         vis_attrs_specs = utils.get_attrs_specs(vis._inferred_intent)
@@ -66,8 +75,12 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
             and ldf.current_vis[0].mark == "line"
             and len(get_filter_specs(ldf.intent)) > 0
         ):
-            query_vc = VisList(ldf.current_vis, ldf)
-            query_vis = query_vc[0]
+            import copy
+
+            query_vis = copy.copy(ldf.current_vis[0])
+            execute_cached(query_vis, ldf)
+            # preprocessing normalizes the data in place, so it is applied to a copy of the shared data
+            query_vis._vis_data = query_vis.data.copy()
             preprocess(query_vis)
             preprocess(vis)
             return 1 - euclidean_dist(query_vis, vis)
@@ -170,18 +183,320 @@ def interestingness(vis: Vis, ldf: LuxDataFrame) -> int:
             raise
 
 
+def batch_interestingness(vlist: VisList, ldf: LuxDataFrame) -> list:
+    """
+    Compute the interestingness scores of all the vis in a VisList.
+    The histograms scored by their skewness and the bar/line charts scored by their unevenness are scored
+    together over their stacked data, while the other vis are scored one at a time by interestingness.
+
+    Parameters
+    ----------
+    vlist : VisList
+    ldf : LuxDataFrame
+
+    Returns
+    -------
+    list
+            Interestingness score of each vis, in the order of the VisList
+    """
+    vis_lst = list(vlist)
+    scores = [None] * len(vis_lst)
+    # histograms with the same number of bins, stacked into a matrix
+    histograms = {}
+    bars = []
+    for i, vis in enumerate(vis_lst):
+        kind = _batch_kind(vis, ldf)
+        if kind == "skewness":
+            histograms.setdefault(len(vis.data), []).append(i)
+        elif kind == "unevenness":
+            bars.append(i)
+        else:
+            scores[i] = interestingness(vis, ldf)
+    for positions in histograms.values():
+        counts = np.stack([vis_lst[i].data["Number of Records"].to_numpy() for i in positions])
+        for i, score in zip(positions, skewness(counts, axis=1).tolist()):
+            scores[i] = score
+    if bars:
+        for i, score in zip(bars, batch_unevenness([vis_lst[i] for i in bars], ldf).tolist()):
+            scores[i] = score
+    return scores
+
+
+def _batch_kind(vis: Vis, ldf: LuxDataFrame):
+    # the score of the vis if it can be computed together with other vis (see interestingness for the cases)
+    if vis.data is None or len(vis.data) < 2:
+        return None
+    if ldf._get_cached_vis(vis) is not None:
+        return None
+    if utils.get_filter_specs(vis._inferred_intent):
+        return None
+    if vis._ndim == 0 and vis._nmsr == 1:
+        if "Number of Records" in vis.data and pd.api.types.is_numeric_dtype(
+            vis.data["Number of Records"]
+        ):
+            return "skewness"
+    elif vis._ndim == 1 and (vis._nmsr == 0 or vis._nmsr == 1):
+        if vis.mark == "geographical" or (
+            ldf.current_vis is not None
+            and len(ldf.current_vis) == 1
+            and ldf.current_vis[0].mark == "line"
+            and len(get_filter_specs(ldf.intent)) > 0
+        ):
+            return None
+        measure_lst = vis.get_attr_by_data_model("measure")
+        attr = vis.get_attr_by_data_model("dimension")[0].attribute
+        if isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
+            attr = str(attr._date_repr)
+        if (
+            len(measure_lst) > 0
+            and measure_lst[0].attribute in vis.data
+            and pd.api.types.is_numeric_dtype(vis.data[measure_lst[0].attribute])
+            and ldf.cardinality
+            and ldf.cardinality.get(attr)
+        ):
+            return "unevenness"
+    return None
+
+
+def batch_unevenness(vis_lst: list, ldf: LuxDataFrame) -> np.ndarray:
+    """
+    Unevenness of many bar charts at once, with the bars of all the charts concatenated into a single array
+    (see unevenness).
+
+    Parameters
+    ----------
+    vis_lst : list
+            List of bar charts
+    ldf : LuxDataFrame
+
+    Returns
+    -------
+    np.ndarray
+            Score describing how uneven each bar chart is
+    """
+    values = []
+    cardinality = []
+    for vis in vis_lst:
+        measure = vis.get_attr_by_data_model("measure")[0].attribute
+        values.append(vis.data[measure].to_numpy(dtype="float64", na_value=np.nan))
+        attr = vis.get_attr_by_data_model("dimension")[0].attribute
+        if isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
+            attr = str(attr._date_repr)
+        cardinality.append(ldf.cardinality[attr])
+    lengths = np.array([len(v) for v in values])
+    charts = np.repeat(np.arange(len(vis_lst)), lengths)
+    v = np.concatenate(values)
+    present = ~np.isnan(v)
+    totals = np.bincount(charts[present], weights=v[present], minlength=len(vis_lst))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # normalize by total to get ratio, where missing bars count as 0
+        v = v / totals[charts]
+    v[np.isnan(v)] = 0
+    cardinality = np.array(cardinality, dtype="float64")
+    distance = np.sqrt(
+        np.bincount(charts, weights=(v - 1 / cardinality[charts]) ** 2, minlength=len(vis_lst))
+    )
+    # cardinality-based discounting factor
+    return 0.9**cardinality * distance
+
+
+def interestingness_upper_bound(vis: Vis, ldf: LuxDataFrame):
+    """
+    Upper bound of the interestingness score of a compiled vis, derived from its intent and the metadata
+    of the dataframe without executing the vis (e.g., the cardinality-based discount of unevenness).
+    The cases follow those of interestingness.
+
+    Parameters
+    ----------
+    vis : Vis
+    ldf : LuxDataFrame
+
+    Returns
+    -------
+    float
+            Upper bound of the score, or None if the score cannot be bounded before executing the vis
+    """
+    filter_specs = utils.get_filter_specs(vis._inferred_intent)
+    n_dim = vis._ndim
+    n_msr = vis._nmsr
+    n_filter = len(filter_specs)
+    dimension_lst = vis.get_attr_by_data_model("dimension")
+    measure_lst = vis.get_attr_by_data_model("measure")
+    cardinality = ldf.cardinality or {}
+
+    # Line/Bar Chart
+    if n_dim == 1 and (n_msr == 0 or n_msr == 1):
+        if (
+            ldf.current_vis is not None
+            and len(ldf.current_vis) == 1
+            and ldf.current_vis[0].mark == "line"
+            and len(get_filter_specs(ldf.intent)) > 0
+        ):
+            # scored by the similarity to the current vis
+            return None
+        if vis.mark == "geographical" or not _is_distribution(measure_lst, ldf):
+            return None
+        if n_filter == 0:
+            attr = dimension_lst[0].attribute
+            if isinstance(attr, pd._libs.tslibs.timestamps.Timestamp):
+                attr = str(attr._date_repr)
+            if attr not in cardinality:
+                return None
+            # the distance between two distributions over at most 2C bars is at most 1, before the discount
+            return max(0.9 ** cardinality[attr], 0.01)
+        elif n_filter == 1:
+            return _deviation_upper_bound(filter_specs, ldf)
+        return None
+    # Histogram
+    elif n_dim == 0 and n_msr == 1:
+        if n_filter == 1 and _is_distribution(measure_lst, ldf):
+            return _deviation_upper_bound(filter_specs, ldf)
+        return None
+    # Scatter Plot
+    elif n_dim == 0 and n_msr == 2:
+        # absolute (weighted) correlation, scaled down by the fraction of filtered rows
+        return 1
+    # Scatterplot colored by Dimension
+    elif n_dim == 1 and n_msr == 2:
+        color_attr = vis.get_attr_by_channel("color")[0].attribute
+        if not cardinality.get(color_attr):
+            return None
+        return 1 / cardinality[color_attr] if cardinality[color_attr] < 40 else -1
+    # Scatterplot colored by measure
+    elif n_msr == 3:
+        return 0.1
+    # colored line and barchart cases
+    elif vis.mark == "line" and n_dim == 2:
+        return 0.15
+    elif vis.mark == "bar" and n_dim == 2:
+        return 0.01
+    # Default
+    else:
+        return -1
+
+
+def _is_distribution(measure_lst: list, ldf: LuxDataFrame) -> bool:
+    # the normalized bars only form a distribution (nonnegative and summing to one) if the measure is nonnegative
+    if len(measure_lst) != 1:
+        return False
+    measure = measure_lst[0]
+    if measure.attribute == "Record":
+        return True
+    min_max = ldf._min_max.get(measure.attribute) if ldf._min_max else None
+    return (
+        isinstance(measure.aggregation, str)
+        and measure.aggregation in ["count", "sum", "mean", "median", "min", "max"]
+        and min_max is not None
+        and min_max[0] >= 0
+    )
+
+
+def _deviation_upper_bound(filter_specs: list, ldf: LuxDataFrame):
+    # the distance between two distributions is at most sqrt(2), and the ranking significance at most 1,
+    # while the significance of the filter is the number of filtered rows over the (at least 2) bars
+    if lux.config.executor.name != "PandasExecutor":
+        return None
+    return np.sqrt(2) * get_filtered_size(filter_specs, ldf) / 2
+
+
+def score_top_k(vlist: VisList, ldf: LuxDataFrame) -> VisList:
+    """
+    Execute and score the vis of a compiled VisList that can still rank among the top lux.config.topk.
+    The vis are executed in batches, in decreasing order of the upper bound of their score
+    (see interestingness_upper_bound), until the upper bound of the remaining vis falls below the score
+    of the k-th best vis so far. These remaining vis cannot make the top-k, and are pruned without being
+    executed. Every vis is executed if the VisList is not truncated to its top-k highest scores.
+
+    Parameters
+    ----------
+    vlist : VisList
+            VisList whose vis are compiled but not executed
+    ldf : LuxDataFrame
+
+    Returns
+    -------
+    VisList
+            Executed and scored vis, in their original order
+    """
+    import heapq
+
+    vis_lst = list(vlist)
+    k = lux.config.topk
+    if k is False or lux.config.sort != "descending":
+        lux.config.executor.execute(vis_lst, ldf)
+        for vis, score in zip(vis_lst, batch_interestingness(vis_lst, ldf)):
+            vis.score = score
+        return VisList(vis_lst)
+    k = abs(k)
+    bounds = []
+    for vis in vis_lst:
+        bound = interestingness_upper_bound(vis, ldf)
+        bounds.append(np.inf if bound is None else bound)
+    # vis bounded by -1 are invalid, and would be removed from the VisList anyway
+    order = sorted((i for i in range(len(vis_lst)) if bounds[i] != -1), key=lambda i: -bounds[i])
+    executed = []
+    top_scores = []
+    start = 0
+    while start < len(order):
+        if len(top_scores) == k and bounds[order[start]] < top_scores[0]:
+            break
+        # the first batch fills the top-k, after which smaller batches let the k-th best score rise sooner
+        batch = order[start : start + (k if start == 0 else TOP_K_BATCH_SIZE)]
+        start += len(batch)
+        batch_vis = [vis_lst[i] for i in batch]
+        lux.config.executor.execute(batch_vis, ldf)
+        for i, vis, score in zip(batch, batch_vis, batch_interestingness(batch_vis, ldf)):
+            vis.score = score
+            executed.append(i)
+            if vis.score != -1 and not pd.isnull(vis.score):
+                # min-heap of the k highest scores so far
+                if len(top_scores) < k:
+                    heapq.heappush(top_scores, vis.score)
+                elif vis.score > top_scores[0]:
+                    heapq.heapreplace(top_scores, vis.score)
+    return VisList([vis_lst[i] for i in sorted(executed)])
+
+
+def execute_cached(vis: Vis, ldf: LuxDataFrame) -> None:
+    """
+    Execute a vis that many scored vis compare against (e.g., the unfiltered vis of deviation_from_overall,
+    or the current vis for similarity), reusing its data if an identical vis was already executed on the same
+    version of the data. The cache is cleared whenever the data is mutated and at every recommendation pass.
+
+    Parameters
+    ----------
+    vis : Vis
+            Compiled vis, whose data should not be modified in place as it is shared
+    ldf : LuxDataFrame
+    """
+    if not hasattr(ldf, "_sync_data_version"):
+        lux.config.executor.execute([vis], ldf)
+        return
+    if getattr(ldf, "_overall_cache", None) is None:
+        from lux.utils.cache import MemoryCache
+
+        ldf._overall_cache = MemoryCache(OVERALL_CACHE_SIZE)
+    key = (utils.get_vis_signature(vis), ldf._sync_data_version())
+    data = ldf._overall_cache.get(key)
+    if data is None:
+        lux.config.executor.execute([vis], ldf)
+        ldf._overall_cache.put(key, vis._vis_data)
+    else:
+        vis._vis_data = data
+
+
 def get_filtered_size(filter_specs, ldf):
     filter_intents = filter_specs[0]
-    result = PandasExecutor.apply_filter(
-        ldf, filter_intents.attribute, filter_intents.filter_op, filter_intents.value
+    # count the filtered rows rather than materializing the filtered dataframe
+    return PandasExecutor.get_filter_count(
+        ldf, [(filter_intents.attribute, filter_intents.filter_op, filter_intents.value)]
     )
-    return len(result)
 
 
-def skewness(v):
+def skewness(v, axis: int = 0):
     from scipy.stats import skew
 
-    return skew(v)
+    return skew(v, axis=axis)
 
 
 def weighted_avg(x, w):
@@ -242,17 +557,24 @@ def deviation_from_overall(
     v_filter = v_filter / total  # normalize by total to get ratio
     if total == 0:
         return 0
-    # Generate an "Overall" Vis (TODO: This is computed multiple times for every vis, alternative is to directly access df.current_vis but we do not have guaruntee that will always be unfiltered vis (in the non-Filter action scenario))
+    # Generate an "Overall" Vis, which is only executed once for all the filtered vis sharing its attributes
     import copy
 
     unfiltered_vis = copy.copy(vis)
     # Remove filters, keep only attribute intent
     unfiltered_vis._inferred_intent = utils.get_attrs_specs(vis._inferred_intent)
-    lux.config.executor.execute([unfiltered_vis], ldf)
+    execute_cached(unfiltered_vis, ldf)
     if exclude_nan:
         uv = unfiltered_vis.data.dropna()
     else:
         uv = unfiltered_vis.data
+    dimension_lst = vis.get_attr_by_data_model("dimension")
+    if len(uv) != len(vdata) and len(dimension_lst) == 1:
+        # Filtered charts over attributes whose unique values are only summarized (see lux.config.unique_values_cap)
+        # are not zero-filled by the executor, so align them against the groups of the overall chart
+        dim_attr = dimension_lst[0].attribute
+        vdata = uv[[dim_attr]].merge(vdata, on=dim_attr, how="left").fillna(0)
+        v_filter = vdata[msr_attribute] / total
     v = uv[msr_attribute]
     v = v / v.sum()
     assert len(v) == len(v_filter), "Data for filtered and unfiltered vis have unequal length."
@@ -268,7 +590,7 @@ def deviation_from_overall(
         v_rank = uv.rank()
         v_filter_rank = vdata.rank()
         # go through and count the number of ranking changes between the filtered and unfiltered data
-        numCategories = ldf.cardinality[dimList[0].attribute]
+        numCategories = min(ldf.cardinality[dimList[0].attribute], len(uv))
         for r in range(0, numCategories - 1):
             if v_rank[msr_attribute][r] != v_filter_rank[msr_attribute][r]:
                 rankSig += 1
@@ -0,0 +1,185 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import lux
+
+# number of fingerprinted metadata entries of the disk cache also kept in memory for the current session
+METADATA_CACHE_SIZE = 32
+
+
+def _hash_values(values) -> np.ndarray:
+    try:
+        return pd.util.hash_pandas_object(values, index=False).values
+    except TypeError:
+        # unhashable object values (e.g., lists) are hashed through their string representation
+        return pd.util.hash_pandas_object(values.astype(str), index=False).values
+
+
+def column_fingerprint(series: pd.Series) -> str:
+    """
+    Fingerprint of a single column, combining its name, dtype and the vectorized hashes of all its values.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to fingerprint
+
+    Returns
+    -------
+    fingerprint: str
+        Hex digest identifying the content of the column
+    """
+    digest = hashlib.sha1(repr((series.name, str(series.dtype))).encode())
+    digest.update(_hash_values(series).tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint(ldf, column_fingerprints: dict = None) -> str:
+    """
+    Fast content fingerprint of a dataframe, combining its shape, index and the fingerprints of its columns.
+    Every value is hashed, so that dataframes that only differ by a few rows never share a fingerprint.
+
+    Parameters
+    ----------
+    ldf : lux.core.frame
+        LuxDataFrame to fingerprint
+    column_fingerprints : dict, optional
+        Fingerprints of the columns that did not change since they were last computed, which are reused
+        rather than rehashed. The fingerprints of the remaining columns are added to it.
+
+    Returns
+    -------
+    fingerprint: str
+        Hex digest identifying the content of the dataframe
+    """
+    # the memoized fingerprints are looked up by name, which is ambiguous for duplicated columns
+    if column_fingerprints is None or not ldf.columns.is_unique:
+        column_fingerprints = {}
+    digest = hashlib.sha1(repr(ldf.shape).encode())
+    digest.update(column_fingerprint(ldf.index.to_series()).encode())
+    for i, attr in enumerate(ldf.columns):
+        if attr not in column_fingerprints:
+            column_fingerprints[attr] = column_fingerprint(ldf.iloc[:, i])
+        digest.update(column_fingerprints[attr].encode())
+    return digest.hexdigest()
+
+
+class MemoryCache:
+    """
+    In-memory mapping that evicts its least-recently-used entries beyond a maximum number of entries,
+    with the same interface as DiskCache.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of entries kept in the cache
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def get(self, key):
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value) -> None:
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+metadata_cache = MemoryCache(METADATA_CACHE_SIZE)
+
+
+class DiskCache:
+    """
+    Directory of pickled entries evicted in least-recently-used order once their total size exceeds a limit.
+    The recency of an entry is tracked through the modification time of its file, which is refreshed on reads.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding the cache entries, created if it does not exist
+    size_limit : float
+        Maximum total size of the cache entries, in megabytes
+    """
+
+    def __init__(self, directory: str, size_limit: float):
+        self.directory = os.path.expanduser(directory)
+        self.size_limit = size_limit * 1024 * 1024
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".pkl")
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+            return value
+        except Exception:
+            # missing, unreadable or incompatible entries are treated as cache misses
+            return None
+
+    def put(self, key: str, value) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self.evict()
+        except Exception:
+            # the cache is only an optimization, so failing to write it should never interrupt Lux
+            pass
+
+    def evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_size <= self.size_limit:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total_size -= size
+
+
+def get_disk_cache():
+    """
+    Disk cache configured through lux.config.cache_dir and lux.config.cache_size, or None if disabled.
+    """
+    if not lux.config.cache_dir:
+        return None
+    return DiskCache(lux.config.cache_dir, lux.config.cache_size)
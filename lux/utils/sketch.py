@@ -0,0 +1,128 @@
+#  Copyright 2019-2020 The Lux Authors.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+import numpy as np
+import pandas as pd
+
+# columns estimated to have at most this many distinct values (or lux.config.unique_values_cap, if set)
+# still get an exact cardinality and their full list of unique values
+EXACT_CARDINALITY_LIMIT = 1000
+# number of rows hashed at a time, so that memory stays bounded on very long columns
+HASH_CHUNK_SIZE = 1000000
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for estimating the number of distinct values of a column in a single pass,
+    using memory proportional to the number of registers rather than to the cardinality.
+
+    Parameters
+    ----------
+    error : float
+        Target relative standard error of the estimate, which determines the number of registers
+    hash_bits : int
+        Width of the hashes added to the sketch (64 for Pandas hashes, 32 for SQL hashes)
+    """
+
+    def __init__(self, error: float = 0.01, hash_bits: int = 64):
+        self.precision = HyperLogLog.precision_for_error(error)
+        self.hash_bits = hash_bits
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    @staticmethod
+    def precision_for_error(error: float) -> int:
+        """
+        Number of index bits p such that the 1.04 / sqrt(2^p) standard error is at most `error`.
+        """
+        precision = math.ceil(math.log2((1.04 / error) ** 2))
+        return min(max(precision, 4), 16)
+
+    @property
+    def num_registers(self) -> int:
+        return len(self.registers)
+
+    def add_hashes(self, hashes: np.ndarray):
+        """
+        Update the registers with an array of uniformly distributed unsigned hashes.
+        """
+        p = self.precision
+        q = self.hash_bits - p
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(q)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << q) - 1)
+        # the rank is the position of the leftmost one bit in the remaining q bits
+        # frexp is exact on 32-bit halves, which avoids float rounding on full 64-bit values
+        high = (remainder >> np.uint64(32)).astype(np.float64)
+        low = (remainder & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        bit_length = np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+        rank = (q + 1 - bit_length).astype(np.int64)
+        # take the per-register maximum rank with a single bincount rather than a slow ufunc.at
+        width = q + 2
+        seen = np.bincount(index * width + rank, minlength=self.num_registers * width)
+        seen = seen.reshape(self.num_registers, width)[:, ::-1] > 0
+        chunk_registers = np.where(seen.any(axis=1), width - 1 - seen.argmax(axis=1), 0)
+        np.maximum(self.registers, chunk_registers.astype(np.uint8), out=self.registers)
+
+    def add_registers(self, index: np.ndarray, rank: np.ndarray):
+        """
+        Merge registers that were computed elsewhere (e.g., inside a SQL database).
+        """
+        np.maximum.at(
+            self.registers, np.asarray(index, dtype=np.int64), np.asarray(rank, dtype=np.uint8)
+        )
+
+    def estimate(self) -> float:
+        m = self.num_registers
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        num_zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # small range correction: linear counting over the empty registers
+            estimate = m * math.log(m / num_zeros)
+        elif self.hash_bits == 32 and estimate > (1 << 32) / 30:
+            # large range correction for hash collisions in 32-bit hash space
+            estimate = -(1 << 32) * math.log(1 - estimate / (1 << 32))
+        return float(estimate)
+
+
+def approx_cardinality(series: pd.Series, error: float = 0.01) -> float:
+    """
+    Estimate the number of distinct values (including NaN) of a series with a HyperLogLog sketch.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column whose cardinality is estimated
+    error : float
+        Target relative standard error of the estimate
+
+    Returns
+    -------
+    estimate: float
+        Approximate number of distinct values in the series
+    """
+    sketch = HyperLogLog(error)
+    for start in range(0, len(series), HASH_CHUNK_SIZE):
+        chunk = series.iloc[start : start + HASH_CHUNK_SIZE]
+        try:
+            hashes = pd.util.hash_pandas_object(chunk, index=False).values
+        except TypeError:
+            # mixed or unhashable object values are hashed through their string representation
+            hashes = pd.util.hash_pandas_object(chunk.astype(str), index=False).values
+        sketch.add_hashes(hashes)
+    return sketch.estimate()
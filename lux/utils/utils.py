@@ -73,36 +73,54 @@ def get_agg_title(clause):
 
 
 def check_if_id_like(df, attribute):
+    """
+    Check whether an attribute holds identifiers, mostly from the metadata that is already computed:
+    the cardinality, along with the string length uniformity or evenly spaced flag kept in the
+    column statistics of the single metadata pass (see PandasExecutor.compute_column_stats).
+    """
     import re
 
     # Strong signals
     # so that aggregated reset_index fields don't get misclassified
     high_cardinality = df.cardinality[attribute] > 500
+    if not high_cardinality:
+        # every ID-like column has a high cardinality, so the remaining checks can be skipped
+        return False
     attribute_contain_id = re.search(r"id|ID|iD|Id", str(attribute)) is not None
     almost_all_vals_unique = df.cardinality[attribute] >= 0.98 * len(df)
-    is_string = pd.api.types.is_string_dtype(df[attribute])
+    column_stats = getattr(df, "_column_stats", None)
+    column_stats = column_stats.get(attribute, {}) if column_stats else {}
+    if "dtype" in column_stats:
+        is_string = pd.api.types.is_string_dtype(column_stats["dtype"])
+    else:
+        is_string = pd.api.types.is_string_dtype(df[attribute])
     if is_string:
         # For string IDs, usually serial numbers or codes with alphanumerics have a consistent length (eg., CG-39405) with little deviation. For a high cardinality string field but not ID field (like Name or Brand), there is less uniformity across the string lengths.
-        if len(df) > 50:
-            if lux.config.executor.name == "PandasExecutor":
-                sampled = df[attribute].sample(50, random_state=99)
-            else:
-                from lux.executor.SQLExecutor import SQLExecutor
-
-                sampled = SQLExecutor.execute_preview(df, preview_size=50)
+        if "str_length_std" in column_stats:
+            str_length_std = column_stats["str_length_std"]
         else:
-            sampled = df[attribute]
-        str_length_uniformity = sampled.apply(lambda x: type(x) == str and len(x)).std() < 3
+            if len(df) > 50:
+                if lux.config.executor.name == "PandasExecutor":
+                    sampled = df[attribute].sample(50, random_state=99)
+                else:
+                    from lux.executor.SQLExecutor import SQLExecutor
+
+                    sampled = SQLExecutor.execute_preview(df, preview_size=50)
+            else:
+                sampled = df[attribute]
+            str_length_std = sampled.apply(lambda x: type(x) == str and len(x)).std()
+        str_length_uniformity = str_length_std < 3
         return (
             high_cardinality
             and (attribute_contain_id or almost_all_vals_unique)
             and str_length_uniformity
         )
     else:
-        if len(df) >= 2:
-            series = df[attribute]
-            diff = series.diff()
-            evenly_spaced = all(diff.iloc[1:] == diff.iloc[1])
+        if "evenly_spaced" in column_stats:
+            evenly_spaced = column_stats["evenly_spaced"]
+        elif len(df) >= 2:
+            diff = df[attribute].diff()
+            evenly_spaced = bool((diff.iloc[1:] == diff.iloc[1]).all())
         else:
             evenly_spaced = True
         if attribute_contain_id:
@@ -110,6 +128,41 @@ def check_if_id_like(df, attribute):
         return high_cardinality and (almost_all_vals_unique or evenly_spaced)
 
 
+def has_all_unique_values(df, attribute):
+    """
+    Check whether the unique_values metadata of an attribute holds every distinct value of the column,
+    rather than the bounded summary of most frequent values kept for high-cardinality columns
+    (see lux.config.unique_values_cap).
+    """
+    if not df.unique_values or not df.cardinality:
+        return True
+    if attribute not in df.unique_values or attribute not in df.cardinality:
+        return True
+    return len(df.unique_values[attribute]) >= df.cardinality[attribute]
+
+
+def get_vis_signature(vis):
+    """
+    Hashable key identifying the mark and encodings of a compiled vis, so that identical
+    visualizations generated by different actions or recomputations can be matched.
+    """
+    signature = [vis.mark]
+    for clause in vis._inferred_intent:
+        value = tuple(clause.value) if isinstance(clause.value, list) else clause.value
+        signature.append(
+            (
+                clause.attribute,
+                clause.channel,
+                clause.data_type,
+                clause.aggregation,
+                clause.bin_size,
+                clause.filter_op,
+                value,
+            )
+        )
+    return tuple(signature)
+
+
 def like_nan(val):
     if isinstance(val, str):
         return val.lower() == "nan"
@@ -146,6 +146,54 @@ def test_remove_invalid_action(global_var):
         lux.config.remove_action("bars")
 
 
+def test_cache_dir(global_var, tmp_path, monkeypatch):
+    from lux.executor.PandasExecutor import PandasExecutor
+
+    monkeypatch.setattr(lux.config, "cache_dir", str(tmp_path))
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert len(list(tmp_path.iterdir())) == 2, "Metadata and recommendations not persisted"
+    scores = {action: [vis.score for vis in vlist] for action, vlist in df.recommendation.items()}
+
+    # a dataframe with identical data reuses the persisted metadata and recommendations
+    compute_stats = PandasExecutor.compute_stats
+    computed = []
+
+    def record_compute_stats(self, ldf, *args, **kwargs):
+        computed.append(ldf)
+        return compute_stats(self, ldf, *args, **kwargs)
+
+    monkeypatch.setattr(PandasExecutor, "compute_stats", record_compute_stats)
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert all(ldf is not df for ldf in computed), "Metadata was recomputed"
+    assert df.data_type["Origin"] == "nominal"
+    assert {
+        action: [vis.score for vis in vlist] for action, vlist in df.recommendation.items()
+    } == scores
+    assert all(vis.data is not None for vlist in df.recommendation.values() for vis in vlist)
+    monkeypatch.setattr(PandasExecutor, "compute_stats", compute_stats)
+
+    df = pd.read_csv("lux/data/car.csv")
+    df["Weight"] = df["Weight"] * 2
+    df._ipython_display_()
+    assert len(list(tmp_path.iterdir())) == 4, "Modified data should not hit the cache"
+
+
+def test_cache_eviction(tmp_path):
+    import os
+    from lux.utils.cache import DiskCache
+
+    cache = DiskCache(str(tmp_path), size_limit=0.01)
+    cache.put("first", "x" * 4000)
+    os.utime(os.path.join(tmp_path, os.listdir(tmp_path)[0]), (0, 0))
+    cache.put("second", "x" * 4000)
+    assert cache.get("second") is not None
+    cache.put("third", "x" * 4000)
+    assert cache.get("first") is None, "Least recently used entry not evicted"
+    assert cache.get("second") is not None and cache.get("third") is not None
+
+
 # TODO: This test does not pass in pytest but is working in Jupyter notebook.
 def test_remove_default_actions(global_var):
     df = pytest.car_df
@@ -244,6 +292,64 @@ def test_sampling_parameters_config():
     lux.config.sampling_start = 10000
 
 
+def test_sampling_method_config(monkeypatch):
+    monkeypatch.setattr(lux.config, "sampling_start", 50)
+    monkeypatch.setattr(lux.config, "sampling_cap", 100)
+    monkeypatch.setattr(lux.config, "sampling_method", "stratified")
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert df.recommendation["Correlation"][0].data.shape[0] == 100
+    # every brand remains in the sample, including the rare ones
+    assert set(df._sampled["Brand"]) == set(df["Brand"])
+    assert set(df._sampled["Cylinders"]) == set(df["Cylinders"])
+    assert "stratified sample" in df._message.to_html()
+
+
+def test_sampling_budget_config(monkeypatch):
+    import numpy as np
+    from lux.executor.PandasExecutor import PandasExecutor
+    from lux.utils.message import Message
+
+    monkeypatch.setattr(lux.config, "sampling_budget", 30)
+    narrow_df = pd.DataFrame(np.random.rand(20000, 10)).add_prefix("col")
+    wide_df = pd.DataFrame(np.random.rand(20000, 100)).add_prefix("col")
+    for df in [narrow_df, wide_df]:
+        df.maintain_metadata()
+        df._message = Message()
+        PandasExecutor.execute_sampling(df)
+    # the 4950 scatterplots of the wide dataframe call for a much smaller sample
+    assert len(narrow_df._sampled) == 20000
+    assert len(wide_df._sampled) < 10000
+    assert f"sample of {len(wide_df._sampled)} rows" in wide_df._message.to_html()
+
+    # the sampling cap still bounds the sample picked from the budget
+    monkeypatch.setattr(lux.config, "sampling_start", 1000)
+    monkeypatch.setattr(lux.config, "sampling_cap", 5000)
+    narrow_df._sampled = None
+    PandasExecutor.execute_sampling(narrow_df)
+    assert len(narrow_df._sampled) == 5000
+
+
+def test_value_index_config(monkeypatch):
+    from lux.executor.PandasExecutor import PandasExecutor
+    from lux.utils.message import Message
+
+    with pytest.warns(UserWarning, match="must be a positive integer or False"):
+        lux.config.value_index_cardinality = 0
+    assert lux.config.value_index_cardinality is False
+    monkeypatch.setattr(lux.config, "value_index_cardinality", 10)
+    monkeypatch.setattr(lux.config, "sampling_start", 50)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    df._message = Message()
+    PandasExecutor.execute_sampling(df)
+    # the sample is indexed separately, since its row positions differ from those of the dataframe
+    sampled = df._sampled
+    assert sampled is not df and "Origin" in sampled._value_index
+    positions = PandasExecutor.get_filter_positions(sampled, [("Origin", "=", "Japan")])
+    assert sampled.iloc[positions].equals(sampled[sampled["Origin"] == "Japan"])
+
+
 def test_heatmap_flag_config():
     df = pd.read_csv("https://raw.githubusercontent.com/lux-org/lux-datasets/master/data/airbnb_nyc.csv")
     df._ipython_display_()
@@ -128,6 +128,12 @@ def test_filter(global_var):
     PandasExecutor.execute_filter(vis)
     assert len(vis.data) == len(df[df["Origin"] == "USA"])
 
+    # only the requested columns of the matching rows are gathered
+    vis._vis_data = df
+    PandasExecutor.execute_filter(vis, ["Horsepower", "Year"])
+    assert list(vis.data.columns) == ["Horsepower", "Year"]
+    assert vis.data.equals(df[df["Origin"] == "USA"][["Horsepower", "Year"]])
+
 
 def test_inequalityfilter(global_var):
     df = pytest.car_df
@@ -164,6 +170,44 @@ def test_binning(global_var):
     assert len(vis.data) == nbins
 
 
+def test_batched_binning(global_var):
+    import numpy as np
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.loc[::5, "Weight"] = np.nan
+    df.maintain_metadata()
+    attributes = ["Horsepower", "Weight", "Acceleration", "Displacement", "MilesPerGal"]
+    vislist = VisList([Vis([lux.Clause(attr)]) for attr in attributes], df)
+    # the histograms are binned together, with the same bins as one at a time
+    assert len(PandasExecutor.execute_batched_binning(vislist, df)) == len(attributes)
+    for vis in vislist:
+        expected = Vis(vis._inferred_intent)
+        expected._inferred_intent = vis._inferred_intent
+        expected._vis_data = df
+        PandasExecutor.execute_binning(df, expected)
+        assert vis.data.to_dict() == expected.data.to_dict()
+    assert "<code>Weight</code> contains missing values" in df._message.to_html()
+
+
+def test_2D_binning(global_var):
+    import numpy as np
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.loc[::9, "Weight"] = np.nan
+    df.maintain_metadata()
+    for color in [[], ["Origin"], ["Acceleration"]]:
+        intent = [lux.Clause("Horsepower", channel="x"), lux.Clause("Weight", channel="y")]
+        intent += [lux.Clause(attr, channel="color") for attr in color]
+        vis = Vis(intent, df)
+        expected = Vis(intent, df)
+        # the cells are counted with np.bincount, with the same bins and cells as the groupby over pd.cut
+        PandasExecutor.execute_2D_binning(vis)
+        PandasExecutor._groupby_2D_binning(expected)
+        for attr in ["xBinEnd", "yBinEnd"]:
+            expected._vis_data[attr] = expected.data[attr].astype("float")
+        pd.testing.assert_frame_equal(pd.DataFrame(vis.data), pd.DataFrame(expected.data))
+
+
 def test_record(global_var):
     df = pytest.car_df
     vis = Vis([lux.Clause(attribute="Cylinders")], df)
@@ -196,3 +240,273 @@ def test_exclude_attribute(global_var):
         assert vis.get_attr_by_channel("x")[0].attribute != "Name"
         assert vis.get_attr_by_channel("y")[0].attribute != "Year"
         assert vis.get_attr_by_channel("y")[0].attribute != "Year"
+
+
+def test_compute_column_stats(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df.loc[0, "Horsepower"] = None
+    df.maintain_metadata()
+    for attr in ["MilesPerGal", "Cylinders", "Horsepower", "Weight"]:
+        assert df._min_max[attr] == (df[attr].min(), df[attr].max())
+        assert df._column_stats[attr]["dtype"] == df.dtypes[attr]
+    assert "Name" not in df._min_max
+    assert df._column_stats["Cylinders"]["evenly_spaced"] is False
+    assert df._column_stats["Name"]["str_length_std"] == pytest.approx(
+        df["Name"].sample(50, random_state=99).str.len().std()
+    )
+
+
+def test_unique_values_cap(global_var, monkeypatch):
+    assert lux.config.unique_values_cap is False
+    monkeypatch.setattr(lux.config, "unique_values_cap", 5)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    assert len(df.unique_values["Brand"]) == 5
+    assert df.cardinality["Brand"] == len(df["Brand"].unique())
+    top_brands = list(df["Brand"].value_counts().index[:5])
+    assert df.unique_values["Brand"] == top_brands
+    assert len(df.unique_values["Origin"]) == df.cardinality["Origin"] == 3
+
+    # bar charts over a summarized attribute should still contain every group
+    vis = Vis([lux.Clause("Brand"), lux.Clause("Origin=USA")], df)
+    assert len(vis.data) == len(df[df["Origin"] == "USA"]["Brand"].unique())
+
+    # the index is summarized by its most frequent values as well
+    df = pd.read_csv("lux/data/car.csv").set_index("Brand")
+    df.maintain_metadata()
+    assert df.unique_values["Brand"] == top_brands
+    assert df.cardinality["Brand"] == len(df)
+
+
+def test_cardinality_sketch(global_var, monkeypatch):
+    import numpy as np
+    from lux.utils.sketch import approx_cardinality
+
+    series = pd.Series(np.arange(200000) % 50000)
+    assert abs(approx_cardinality(series, 0.01) - 50000) < 50000 * 0.05
+    assert approx_cardinality(pd.Series(["a", "b", None] * 1000), 0.01) == pytest.approx(3, abs=0.1)
+
+    monkeypatch.setattr(lux.config, "cardinality_sketch_threshold", 100)
+    monkeypatch.setattr(lux.config, "unique_values_cap", 50)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    # low-cardinality columns still get an exact answer for the type thresholds
+    assert df.cardinality["Cylinders"] == len(df["Cylinders"].unique())
+    assert df.data_type["Cylinders"] == "nominal"
+    assert set(df.unique_values["Origin"]) == set(df["Origin"].unique())
+    exact = len(df["Name"].unique())
+    assert abs(df.cardinality["Name"] - exact) < exact * 0.05
+    assert len(df.unique_values["Name"]) == 50
+    assert not lux.utils.utils.has_all_unique_values(df, "Name")
+
+
+def test_metadata_threads(global_var, monkeypatch):
+    df = pd.read_csv("lux/data/college.csv")
+    df.maintain_metadata()
+    monkeypatch.setattr(lux.config, "metadata_threads", 4)
+    threaded_df = pd.read_csv("lux/data/college.csv")
+    threaded_df.maintain_metadata()
+    assert threaded_df.data_type == df.data_type
+    assert threaded_df.cardinality == df.cardinality
+    assert threaded_df.unique_values == df.unique_values
+    assert threaded_df._min_max == df._min_max
+
+
+def test_batched_aggregate(global_var):
+    df = pytest.car_df
+    measures = ["MilesPerGal", "Horsepower", "Weight"]
+    intent = [lux.Clause("Origin"), lux.Clause("Cylinders=8")]
+    vislist = VisList(
+        [Vis([lux.Clause(measure, channel="y"), *intent]) for measure in measures]
+        + [
+            Vis([lux.Clause("Horsepower", channel="y", aggregation="sum"), *intent]),
+            Vis([lux.Clause("Record"), *intent]),
+        ],
+        df,
+    )
+    # the vis share the group-by and filter, so they are aggregated together
+    assert len(PandasExecutor.execute_batched_aggregate(vislist, df)) == 5
+    for vis in vislist:
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_dict() == expected.data.to_dict()
+
+
+def test_filter_cache(global_var, monkeypatch):
+    from lux.interestingness.interestingness import get_filtered_size
+
+    df = pd.read_csv("lux/data/car.csv")
+    df._repr_html_()
+    calls = []
+    get_filter_mask = PandasExecutor._get_filter_mask
+
+    def record_filter_mask(df, attribute, op, val):
+        calls.append((attribute, op, val))
+        return get_filter_mask(df, attribute, op, val)
+
+    monkeypatch.setattr(PandasExecutor, "_get_filter_mask", record_filter_mask)
+    origin_usa = lux.Clause(attribute="Origin", filter_op="=", value="USA")
+    filtered = PandasExecutor.apply_filter(df, "Origin", "=", "USA")
+    assert len(filtered) == len(df[df["Origin"] == "USA"])
+    assert get_filtered_size([origin_usa], df) == len(filtered)
+    intent = [lux.Clause("Origin=USA"), lux.Clause("Cylinders=8")]
+    vislist = VisList([Vis([lux.Clause(attr), *intent]) for attr in ["Horsepower", "Weight"]], df)
+    expected = df[(df["Origin"] == "USA") & (df["Cylinders"] == 8)]
+    # each predicate is only evaluated once across the filter, the size and the vis
+    assert calls == [("Origin", "=", "USA"), ("Cylinders", "=", 8)]
+    for vis in vislist:
+        assert vis.data["Number of Records"].sum() == len(expected)
+
+    # mutating the data invalidates the cached filters
+    df.loc[df["Origin"] == "USA", "Origin"] = "Japan"
+    assert get_filtered_size([origin_usa], df) == 0
+    assert Vis(["Horsepower", "Origin=USA"], df).data["Number of Records"].sum() == 0
+    df["Origin"] = "USA"
+    assert get_filtered_size([origin_usa], df) == len(df)
+
+
+def test_batched_filter_values(global_var):
+    df = pytest.car_df
+    df.maintain_metadata()
+    intent = [lux.Clause("Origin"), lux.Clause("Horsepower")]
+    vislist = VisList(
+        [
+            Vis(intent + [lux.Clause(attribute="Cylinders", filter_op="=", value=val)])
+            for val in df.unique_values["Cylinders"]
+        ],
+        df,
+    )
+    # the vis only differ by the value of the Cylinders filter, so they are aggregated together
+    assert len(PandasExecutor.execute_batched_aggregate(vislist, df)) == len(vislist)
+    for vis in vislist:
+        expected = Vis(vis._inferred_intent, df)
+        assert vis.data.to_dict() == expected.data.to_dict()
+
+    # filter values of datetime columns are not looked up among the grouped values
+    df = pd.read_csv("lux/data/car.csv")
+    df["Year"] = pd.to_datetime(df["Year"], format="%Y")
+    df.maintain_metadata()
+    vislist = VisList(["Origin", "Year=?"], df)
+    counts = df["Year"].value_counts()
+    for vis in vislist:
+        year = [clause.value for clause in vis._inferred_intent if clause.value != ""][0]
+        assert vis.data["Record"].sum() == counts[year]
+
+
+def test_value_index(global_var, monkeypatch):
+    from lux.interestingness.interestingness import get_filtered_size
+
+    monkeypatch.setattr(lux.config, "value_index_cardinality", 30)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    assert "Origin" in df._value_index and "Name" not in df._value_index
+
+    def fail_filter_mask(*args):
+        raise AssertionError("filters on indexed columns should not scan the column")
+
+    monkeypatch.setattr(PandasExecutor, "_get_filter_mask", fail_filter_mask)
+    for op in ["=", "!=", "<", ">="]:
+        positions = PandasExecutor.get_filter_positions(df, [("Cylinders", op, 6)])
+        expected = df[eval(f"df['Cylinders'] {'==' if op == '=' else op} 6")]
+        assert len(positions) == len(expected)
+        assert PandasExecutor.apply_filter(df, "Cylinders", op, 6).equals(expected)
+    origin_usa = lux.Clause(attribute="Origin", filter_op="=", value="USA")
+    assert get_filtered_size([origin_usa], df) == len(df[df["Origin"] == "USA"])
+
+    # assigning a column drops its index until the metadata is recomputed
+    df["Origin"] = df["Origin"].str.lower()
+    assert "Origin" not in df._value_index
+    df.maintain_metadata()
+    assert get_filtered_size([origin_usa], df) == 0
+
+
+def test_value_index_cached_metadata(global_var, tmp_path, monkeypatch):
+    monkeypatch.setattr(lux.config, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(lux.config, "value_index_cardinality", 30)
+    pd.read_csv("lux/data/car.csv")._ipython_display_()
+    compute_stats = PandasExecutor.compute_stats
+    computed = []
+
+    def record_compute_stats(self, ldf, *args, **kwargs):
+        computed.append(ldf)
+        return compute_stats(self, ldf, *args, **kwargs)
+
+    monkeypatch.setattr(PandasExecutor, "compute_stats", record_compute_stats)
+    # the index is rebuilt when the metadata of identical data is loaded from the cache
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert all(ldf is not df for ldf in computed), "Metadata was recomputed"
+    assert "Origin" in df._value_index and "Name" not in df._value_index
+
+
+def test_sort_index(global_var):
+    from lux.interestingness.interestingness import get_filtered_size
+
+    df = pd.read_csv("lux/data/car.csv")
+    thresholds = [60, 95.5, 150, 230]
+    for threshold in thresholds:
+        for op in ["<", ">", "<=", ">="]:
+            fltr = lux.Clause(attribute="Horsepower", filter_op=op, value=threshold)
+            expected = df[eval(f"df['Horsepower'] {op} {threshold}")]
+            assert get_filtered_size([fltr], df) == len(expected)
+            assert PandasExecutor.apply_filter(df, "Horsepower", op, threshold).equals(expected)
+    # the column is only sorted once it is range filtered repeatedly
+    sorted_values, order = df._sort_index["Horsepower"]
+    assert list(sorted_values) == sorted(df["Horsepower"].dropna())
+    assert "Horsepower" not in df._sort_index_filters
+    PandasExecutor.apply_filter(df, "Weight", ">", 3000)
+    assert "Weight" not in df._sort_index and df._sort_index_filters["Weight"] == 1
+
+    # mutating the data drops the sort index
+    df["Horsepower"] = df["Horsepower"] * 2
+    assert "Horsepower" not in (df._sort_index or {})
+    assert PandasExecutor.get_filter_count(df, [("Horsepower", ">", 300)]) == len(
+        df[df["Horsepower"] > 300]
+    )
+
+
+def test_data_cube(global_var, monkeypatch):
+    df = pd.read_csv("lux/data/car.csv")
+    intents = [
+        [lux.Clause("Origin")],
+        [lux.Clause("Cylinders"), lux.Clause("Origin", channel="color")],
+        [lux.Clause("Origin"), lux.Clause(attribute="Cylinders", filter_op="=", value=8)],
+    ]
+    expected = [Vis(intent, df).data for intent in intents]
+    monkeypatch.setattr(lux.config, "data_cube_cardinality", 30)
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    assert df._data_cube["columns"]["Origin"]["counts"].sum() == len(df)
+    assert ("Cylinders", "Origin") in df._data_cube["pairs"] or ("Origin", "Cylinders") in df._data_cube[
+        "pairs"
+    ]
+    vislist = VisList([Vis(intent) for intent in intents], df)
+    # the Record counts are looked up from the cube instead of grouping the data
+    assert len(PandasExecutor.execute_cube_aggregate(vislist, df)) == 3
+    for vis, expected_data in zip(vislist, expected):
+        assert vis.data.to_dict() == expected_data.to_dict()
+
+    # assigning a column drops its counts until the metadata is recomputed
+    df["Origin"] = df["Origin"].str.lower()
+    assert "Origin" not in df._data_cube["columns"]
+    df.maintain_metadata()
+    assert "usa" in df._data_cube["columns"]["Origin"]["slots"]
+
+
+def test_data_cube_cached_metadata(global_var, tmp_path, monkeypatch):
+    monkeypatch.setattr(lux.config, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(lux.config, "data_cube_cardinality", 30)
+    pd.read_csv("lux/data/car.csv")._ipython_display_()
+    compute_stats = PandasExecutor.compute_stats
+    computed = []
+
+    def record_compute_stats(self, ldf, *args, **kwargs):
+        computed.append(ldf)
+        return compute_stats(self, ldf, *args, **kwargs)
+
+    monkeypatch.setattr(PandasExecutor, "compute_stats", record_compute_stats)
+    # the cube is rebuilt when the metadata of identical data is loaded from the cache
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert all(ldf is not df for ldf in computed), "Metadata was recomputed"
+    counts = PandasExecutor._count_from_cube(df._sampled, ["Origin", "Cylinders"])
+    assert counts is not None and counts["Record"].sum() == len(df)
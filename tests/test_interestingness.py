@@ -18,6 +18,7 @@ import pandas as pd
 import numpy as np
 import psycopg2
 from lux.interestingness.interestingness import interestingness
+from lux.utils import utils
 
 
 # The following test cases are labelled for vis with <Ndim, Nmsr, Nfilter>
@@ -308,3 +309,102 @@ def test_interestingness_deviation_nan():
     assert np.isclose(smaller_diff_score, 0.19, rtol=0.1)
     assert np.isclose(bigger_diff_score, 0.62, rtol=0.1)
     assert smaller_diff_score < bigger_diff_score
+
+
+def test_correlation_matrix_score(global_var):
+    from lux.action.correlation import correlation
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.loc[::7, "Weight"] = np.nan
+    df["Constant"] = 3.3
+    for intent in [[], [lux.Clause(attribute="Origin", filter_op="=", value="USA")]]:
+        df.set_intent(intent)
+        collection = correlation(df)["collection"]
+        assert len(collection) > 0
+        # the pairs scored from the correlation matrix are scored like their executed scatterplot
+        for vis in collection:
+            assert vis.data is not None
+            assert np.isclose(vis.score, interestingness(vis, df))
+            assert "Constant" not in [clause.attribute for clause in vis._inferred_intent]
+
+
+def test_score_top_k(global_var):
+    from lux.interestingness.interestingness import interestingness_upper_bound, score_top_k
+    from lux.vis.VisList import VisList
+
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({"Value": rng.rand(3000)})
+    for i in range(30):
+        cardinality = 2 + 2 * i
+        weights = rng.dirichlet(np.ones(cardinality) * 0.3)
+        df[f"Category{i}"] = rng.choice([f"c{j}" for j in range(cardinality)], len(df), p=weights)
+    df.maintain_metadata()
+    intent = [lux.Clause("?", data_type="nominal")]
+    full = VisList(intent, df)
+    for vis in full:
+        vis.score = interestingness(vis, df)
+        assert vis.score <= interestingness_upper_bound(vis, df)
+    pruned = VisList(intent)
+    pruned.refresh_source(df, execute=False)
+    pruned = score_top_k(pruned, df)
+    # the bar charts of high-cardinality attributes cannot make the top-k, so they are never executed
+    assert len(pruned) < len(full)
+    full.sort()
+    pruned.sort()
+    top_k = [(vis.get_attr_by_channel("y")[0].attribute, vis.score) for vis in pruned.showK()]
+    expected = [(vis.get_attr_by_channel("y")[0].attribute, vis.score) for vis in full.showK()]
+    assert [attr for attr, _ in top_k] == [attr for attr, _ in expected]
+    assert np.allclose([score for _, score in top_k], [score for _, score in expected])
+
+
+def test_batch_interestingness(global_var):
+    from lux.interestingness.interestingness import batch_interestingness
+    from lux.vis.VisList import VisList
+
+    df = pd.read_csv("lux/data/car.csv")
+    df["Year"] = pd.to_datetime(df["Year"], format="%Y")
+    df.loc[::7, "Weight"] = np.nan
+    df.maintain_metadata()
+    for intent in [
+        [lux.Clause("?", data_type="quantitative")],
+        [lux.Clause("?", data_type="nominal")],
+        [lux.Clause("Origin"), lux.Clause("?")],
+    ]:
+        vlist = VisList(intent, df)
+        # the histograms and bar charts are scored together, like one at a time
+        scores = batch_interestingness(vlist, df)
+        assert np.allclose(scores, [interestingness(vis, df) for vis in vlist])
+
+
+def test_overall_cache(global_var, monkeypatch):
+    from lux.executor.PandasExecutor import PandasExecutor
+    from lux.vis.Vis import Vis
+
+    df = pd.read_csv("lux/data/car.csv")
+    df.maintain_metadata()
+    executed = []
+    execute = PandasExecutor.execute
+
+    def record_execute(vislist, ldf):
+        executed.extend(utils.get_filter_specs(vis._inferred_intent) for vis in vislist)
+        return execute(vislist, ldf)
+
+    monkeypatch.setattr(PandasExecutor, "execute", staticmethod(record_execute))
+    scores = []
+    for origin in ["USA", "Japan", "Europe"]:
+        vis = Vis(
+            [lux.Clause("Cylinders"), lux.Clause(attribute="Origin", filter_op="=", value=origin)], df
+        )
+        scores.append(interestingness(vis, df))
+    # the unfiltered vis is only executed for the first filtered vis
+    assert [len(filters) for filters in executed] == [1, 0, 1, 1]
+    # mutating the data invalidates the cached overall vis
+    df["Cylinders"] = df["Cylinders"] + 1
+    vis = Vis([lux.Clause("Cylinders"), lux.Clause(attribute="Origin", filter_op="=", value="USA")], df)
+    assert np.isclose(interestingness(vis, df), scores[0])
+    assert [len(filters) for filters in executed] == [1, 0, 1, 1, 1, 0]
+    # and so do in-place edits of its values
+    df.loc[df["Origin"] == "Japan", "Cylinders"] = 9
+    vis = Vis([lux.Clause("Cylinders"), lux.Clause(attribute="Origin", filter_op="=", value="USA")], df)
+    assert not np.isclose(interestingness(vis, df), scores[0])
+    assert [len(filters) for filters in executed] == [1, 0, 1, 1, 1, 0, 1, 0]
@@ -101,3 +101,199 @@ def test_intent_cleared_after_vis_data():
     all_column_vis = vis.data.current_vis[0]
     assert all_column_vis.get_attr_by_channel("x")[0].attribute == "Year"
     assert all_column_vis.get_attr_by_channel("y")[0].attribute == "PctForeclosured"
+
+
+def test_metadata_column_assignment(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    weight_stats = df._column_stats["Weight"]
+    df["Weight2"] = df["Weight"] * 2
+    assert df._metadata_fresh == False, "Failed to expire metadata after assigning a column"
+    assert df._dirty_columns == {"Weight2"}
+    df.maintain_metadata()
+    assert df._metadata_fresh == True
+    assert df._column_stats["Weight"] is weight_stats, "Metadata of unchanged columns was recomputed"
+    assert df.data_type["Weight2"] == "quantitative"
+    assert df._min_max["Weight2"] == (df["Weight"].min() * 2, df["Weight"].max() * 2)
+
+
+def test_recs_column_assignment(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    kept_data = {}
+    for vis in df.recommendation["Distribution"]:
+        if vis.get_attr_by_channel("x")[0].attribute != "Horsepower":
+            kept_data[str(vis)] = vis.data.copy()
+    assert len(kept_data) > 0
+    max_horsepower = df["Horsepower"].max()
+    df["Horsepower"] = df["Horsepower"] * 2
+    assert df._recs_fresh == False
+    assert all("Horsepower" not in cached["attributes"] for cached in df._vis_cache.values())
+    df._ipython_display_()
+    for vis in df.recommendation["Distribution"]:
+        if vis.get_attr_by_channel("x")[0].attribute == "Horsepower":
+            assert (
+                vis.data["Horsepower"].max() > max_horsepower
+            ), "Vis of assigned column was not recomputed"
+        else:
+            assert df._get_cached_vis(vis) is not None, "Vis of unchanged column was recomputed"
+            assert vis.data.equals(kept_data[str(vis)])
+            # the cached data is copied, so that rendering the vis does not modify it
+            assert vis.data is not df._get_cached_vis(vis)["data"]
+
+    # the cached vis are not reused for other rows, e.g., a sample drawn differently
+    sampled = df._sampled
+    df._sampled = df.iloc[::2]
+    assert all(df._get_cached_vis(vis) is None for vis in df.recommendation["Distribution"])
+    df._sampled = sampled
+
+    # changing the dtype of a column splits the blocks of the dataframe, which pandas later consolidates
+    df["Weight"] = df["Weight"] * 1.5
+    df.describe()
+    df.maintain_metadata()
+    assert all("Weight" not in cached["attributes"] for cached in df._vis_cache.values())
+    assert any("Acceleration" in cached["attributes"] for cached in df._vis_cache.values())
+
+
+def test_metadata_attribute_access(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    version = df._data_version
+    df.Weight
+    df.Horsepower.mean()
+    assert df._metadata_fresh == True, "Reading a column as an attribute expired the metadata"
+    assert df._recs_fresh == True, "Reading a column as an attribute expired the recommendations"
+    assert df._data_version == version
+
+
+def test_metadata_untracked_mutation(global_var):
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    version = df._data_version
+    df.loc[0, "Weight"] = 0
+    assert df._data_version > version
+    df.maintain_metadata()
+    assert df._min_max["Weight"][0] == 0
+    df.at[1, "Acceleration"] = -1
+    df["Horsepower"].fillna(-5, inplace=True)
+    df.maintain_metadata()
+    assert df._min_max["Acceleration"][0] == -1
+
+    # columns deleted or inserted in place are tracked as well
+    del df["Acceleration"]
+    df.maintain_metadata()
+    assert "Acceleration" not in df.data_type
+    df.insert(0, "Weight2", df["Weight"] * 2)
+    df.maintain_metadata()
+    assert df.data_type["Weight2"] == "quantitative"
+
+
+def test_metadata_mutation_routes(global_var):
+    weight = pd.read_csv("lux/data/car.csv")["Weight"].copy()
+    weight[0] = -7
+    position = list(pd.read_csv("lux/data/car.csv").columns).index("Weight")
+
+    def set_loc(df):
+        df.loc[0, "Weight"] = -7
+
+    def set_loc_mask(df):
+        df.loc[df.index == 0, "Weight"] = -7
+
+    def set_iloc(df):
+        df.iloc[0, position] = -7
+
+    def set_at(df):
+        df.at[0, "Weight"] = -7
+
+    def set_iat(df):
+        df.iat[0, position] = -7
+
+    def set_column(df):
+        df["Weight"] = weight
+
+    def set_columns(df):
+        df[["Weight"]] = weight.to_frame()
+
+    routes = {
+        "loc": set_loc,
+        "loc mask": set_loc_mask,
+        "iloc": set_iloc,
+        "at": set_at,
+        "iat": set_iat,
+        "column": set_column,
+        "column list": set_columns,
+    }
+    for route, mutate in routes.items():
+        df = pd.read_csv("lux/data/car.csv")
+        df.maintain_metadata()
+        version = df._data_version
+        mutate(df)
+        assert df._data_version > version, route
+        # only the written column is recomputed
+        assert df._dirty_columns == {"Weight"}, route
+        df.maintain_metadata()
+        assert df._min_max["Weight"][0] == -7, route
+
+    # rows written through a mask may affect every column
+    df = pd.read_csv("lux/data/car.csv")[["Weight", "Acceleration"]]
+    df.maintain_metadata()
+    df[df["Weight"] > 0] = -7
+    df.maintain_metadata()
+    assert df._min_max["Weight"][0] == df._min_max["Acceleration"][0] == -7
+
+
+def test_fingerprint(global_var, tmp_path, monkeypatch):
+    df = pd.read_csv("lux/data/car.csv")
+    fingerprint = df.fingerprint
+    assert pd.read_csv("lux/data/car.csv").fingerprint == fingerprint
+    df["Weight"] = df["Weight"] * 2
+    # only the fingerprint of the assigned column is rehashed
+    assert set(df._column_fingerprints) == set(df.columns) - {"Weight"}
+    assert df.fingerprint != fingerprint
+    df["Weight"] = pd.read_csv("lux/data/car.csv")["Weight"]
+    assert df.fingerprint == fingerprint
+
+    # every row of longer dataframes is hashed, and the memoized fingerprint is updated on mutation
+    df = pd.DataFrame({"a": range(100000), "b": ["x", "y"] * 50000})
+    fingerprint = df.fingerprint
+    df.loc[500, "b"] = "z"
+    assert df.fingerprint != fingerprint
+    df["a"][501] = -1
+    assert set(df._column_fingerprints) == {"b"}
+    monkeypatch.setattr(lux.config, "cache_dir", str(tmp_path))
+    df.maintain_metadata(use_cache=True)
+    new_df = pd.DataFrame({"a": range(100000), "b": ["x", "y"] * 50000})
+    new_df.loc[502, "a"] = 10**9
+    new_df.maintain_metadata(use_cache=True)
+    assert new_df._min_max["a"] == (0, 10**9)
+
+
+def test_metadata_identical_data(global_var, tmp_path, monkeypatch):
+    from lux.executor.PandasExecutor import PandasExecutor
+
+    # dataframes are not fingerprinted unless a cache is configured
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    assert df._fingerprint is None
+
+    monkeypatch.setattr(lux.config, "cache_dir", str(tmp_path))
+    df = pd.read_csv("lux/data/car.csv")
+    df._ipython_display_()
+    compute_stats = PandasExecutor.compute_stats
+    computed = []
+
+    def record_compute_stats(self, ldf, *args, **kwargs):
+        computed.append(ldf)
+        return compute_stats(self, ldf, *args, **kwargs)
+
+    monkeypatch.setattr(PandasExecutor, "compute_stats", record_compute_stats)
+    new_df = pd.read_csv("lux/data/car.csv")
+    new_df._ipython_display_()
+    assert all(ldf is not new_df for ldf in computed), "Metadata was recomputed for identical data"
+    assert new_df.data_type == df.data_type
+    assert new_df.cardinality == df.cardinality
+
+    # the reused metadata is updated without affecting the dataframe it was computed on
+    new_df["Weight"] = new_df["Weight"] * 2
+    new_df.maintain_metadata()
+    assert new_df._min_max["Weight"] != df._min_max["Weight"]
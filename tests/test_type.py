@@ -17,6 +17,7 @@ import pytest
 import random
 import pandas as pd
 import warnings
+from lux.vis.Vis import Vis
 
 
 # Suite of test that checks if data_type inferred correctly by Lux
@@ -158,6 +159,58 @@ def test_check_datetime_numeric_values():
     assert spotify_df.data_type["release_date"] == "temporal"
 
 
+def test_check_datetime_sampled(monkeypatch):
+    from lux.executor.PandasExecutor import PandasExecutor
+
+    months = ["Jan 2020", "Feb 2020", "Mar 2020", "Apr 2020", "May 2020", "Jun 2020"]
+    df = pd.DataFrame(
+        {
+            "period": months * 500,
+            "label": ["x", "y", "2020-01-01"] * 1000,
+            "value": [i * 0.5 for i in range(3000)],
+        }
+    )
+    to_datetime = pd.to_datetime
+    parsed_lengths = []
+
+    def record_to_datetime(arg, *args, **kwargs):
+        parsed_lengths.append(len(arg))
+        return to_datetime(arg, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "to_datetime", record_to_datetime)
+    df.maintain_metadata()
+    assert df.data_type["period"] == "temporal"
+    assert df.data_type["label"] == "nominal"
+    # the types are decided from a sample, and only the distinct values of datetime-like columns are all parsed
+    assert 0 < len(parsed_lengths) and max(parsed_lengths) <= 1000
+    assert len(months) in parsed_lengths
+    assert list(df._datetime_lookups["period"].index) == months
+
+    # a value outside of the sample that does not parse rules out the column
+    sampled = PandasExecutor._type_inference_sample(pd.Series(range(3000))).index
+    unsampled = min(set(range(3000)) - set(sampled))
+    mostly_dates = months * 500
+    mostly_dates[unsampled] = "not a date"
+    df["mostly_dates"] = mostly_dates
+    df.maintain_metadata()
+    assert df.data_type["mostly_dates"] == "nominal"
+    assert "mostly_dates" not in df._datetime_lookups
+
+    # a sample without any non-null value is ambiguous, so the full column is parsed instead
+    sparse_dates = [None] * 3000
+    sparse_dates[unsampled] = "2020-01-01"
+    df["sparse_dates"] = sparse_dates
+    del parsed_lengths[:]
+    df.maintain_metadata()
+    assert df.data_type["sparse_dates"] == "temporal"
+    assert len(df) in parsed_lengths
+    monkeypatch.undo()
+
+    # the aggregated temporal strings are ordered chronologically
+    vis = Vis(["period", "value"], df)
+    assert list(vis.data["period"]) == months
+
+
 def test_check_stock():
     df = pd.read_csv("https://github.com/lux-org/lux-datasets/blob/master/data/stocks.csv?raw=true")
     df.maintain_metadata()
@@ -383,3 +436,28 @@ def test_id_absenteeism_data():
         "Body mass index": "nominal",
         "Absenteeism time in hours": "nominal",
     }
+
+
+def test_id_from_column_stats(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "order_id": range(1000, 3000),
+            "amount": [i % 7 for i in range(2000)],
+            "code": [f"CG-{i:05d}" for i in range(2000)],
+            "name": ["x" * (i % 20) + str(i) for i in range(2000)],
+        }
+    )
+
+    # ID detection relies on the statistics gathered in the metadata pass, instead of rescanning the columns
+    def fail(*args, **kwargs):
+        raise AssertionError("Column was rescanned for ID detection")
+
+    monkeypatch.setattr(pd.Series, "diff", fail)
+    monkeypatch.setattr(pd.Series, "sample", fail)
+    df.maintain_metadata()
+    assert df._column_stats["order_id"]["evenly_spaced"]
+    assert df._column_stats["code"]["str_length_std"] == 0
+    assert df.data_type["order_id"] == "id"
+    assert df.data_type["amount"] == "nominal"
+    assert df.data_type["code"] == "id"
+    assert df.data_type["name"] == "nominal"